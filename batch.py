@@ -0,0 +1,180 @@
+import numpy as np
+
+from card import Card
+from shuffle import Shuffle
+
+# Outcome recorded for rounds a game did not get to play.
+NOT_PLAYED = -2
+
+deck_size = 52
+max_shuffle = 6
+
+# Blackjack value of each card code, with aces counted as 1.
+card_values = np.array([c.get_value() for c in Card.all_cards()], \
+    dtype=np.int16)
+card_aces = card_values == 1
+
+# Permutations indexed by [cards left, modified overhand, mongean].
+_shuffle_table = None
+
+
+def shuffle_table():
+    """
+    Returns the array of the combined `Deck.shuffle` permutations for
+    every number of cards left in a deck and every pair of shuffle counts
+    drawn by `Blackjack.play_round`. Row (n, a, b) holds the n-card
+    permutation padded with zeros to the size of a deck.
+    """
+    global _shuffle_table
+
+    if _shuffle_table is None:
+        table = np.zeros((deck_size + 1, max_shuffle, max_shuffle, \
+            deck_size), dtype=np.int16)
+        for n in range(deck_size + 1):
+            for a in range(max_shuffle):
+                overhand = Shuffle.permutation(n, 'modified_overhand', a)
+                for b in range(max_shuffle):
+                    table[n, a, b, :n] = Shuffle.apply(overhand, \
+                        Shuffle.permutation(n, 'mongean', b))
+        _shuffle_table = table
+
+    return _shuffle_table
+
+
+def score(hard_total, num_aces):
+    """
+    Returns the best scores of hands with the given hard totals and ace
+    counts, as `PlayerHand.get_score` does.
+    """
+    return np.where((num_aces > 0) & (hard_total + 10 <= 21), \
+        hard_total + 10, hard_total)
+
+
+def determine_winner(player_score, dealer_score):
+    """
+    Returns 1 where the player won, 0 for ties and -1 where the dealer
+    won, as `Blackjack.determine_winner` does.
+
+    >>> determine_winner(np.array([10, 21, 22, 12, 22, 2]), \\
+    ...     np.array([12, 21, 23, 2, 2, 22]))
+    array([-1,  0,  0,  1, -1,  1], dtype=int8)
+    """
+    player_bust = player_score > 21
+    dealer_bust = dealer_score > 21
+    result = np.where(player_bust, -1, np.sign(player_score - dealer_score))
+    result = np.where(dealer_bust, 1, result)
+    result = np.where(player_bust & dealer_bust, 0, result)
+
+    return result.astype(np.int8)
+
+
+def play_rounds(num_games, num_rounds, stand_threshold, wallet, rng=None):
+    """
+    Plays `num_rounds` rounds of `num_games` independent games of
+    Blackjack at once, following the rules of `Blackjack.play_round`.
+
+    Parameters:
+        num_games (int): Number of games to play.
+        num_rounds (int): Number of rounds to play in each game.
+        stand_threshold: Score at which the player stands, either one
+        int or an array with one threshold per game.
+        wallet: Starting wallet, either one number or an array with one
+        wallet per game.
+        rng: numpy Generator or RandomState the shuffle counts are drawn
+        from. A RandomState draws the same numbers, in the same order, as
+        the global `randint` used by `Blackjack` for a single game.
+    Returns:
+        A tuple (outcomes, wallets) of (num_games, num_rounds) arrays.
+        outcomes holds the result of each round as returned by
+        `Blackjack.determine_winner`, or NOT_PLAYED once a game has ended
+        for lack of cards or money. wallets holds the wallet after each
+        round.
+
+    >>> outcomes, wallets = play_rounds(1, 1, 15, 10, \\
+    ...     np.random.RandomState(20))
+    >>> outcomes, wallets
+    (array([[1]], dtype=int8), array([[15]]))
+
+    >>> outcomes, wallets = play_rounds(1000, 20, 21, 5, \\
+    ...     np.random.default_rng(0))
+    >>> outcomes.shape
+    (1000, 20)
+    >>> bool((outcomes[:, -1] == NOT_PLAYED).all())
+    True
+    >>> bool((wallets[outcomes[:, -1] == NOT_PLAYED, -1] >= 0).all())
+    True
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    draw = getattr(rng, 'integers', None) or rng.randint
+
+    games = np.arange(num_games)
+    positions = np.arange(deck_size)
+    threshold = np.broadcast_to(stand_threshold, (num_games,))
+    table = shuffle_table()
+
+    decks = np.tile(np.arange(deck_size, dtype=np.int16), (num_games, 1))
+    cursor = np.zeros(num_games, dtype=np.int64)
+    money = np.array(np.broadcast_to(wallet, (num_games,)))
+    bet = np.full(num_games, 5, dtype=money.dtype)
+    active = np.ones(num_games, dtype=bool)
+
+    outcomes = np.full((num_games, num_rounds), NOT_PLAYED, dtype=np.int8)
+    wallets = np.empty((num_games, num_rounds), dtype=money.dtype)
+
+    for r in range(num_rounds):
+        active &= deck_size - cursor >= 4
+        active &= money >= bet
+        if not active.any():
+            wallets[:, r:] = money[:, None]
+            break
+
+        # Shuffle the cards left in each deck
+        counts = draw(max_shuffle, size=(num_games, 2))
+        left = deck_size - cursor
+        perms = table[left, counts[:, 1], counts[:, 0]]
+        offset = positions - cursor[:, None]
+        source = np.take_along_axis(perms, np.maximum(offset, 0), axis=1) \
+            + cursor[:, None]
+        source = np.where(offset >= 0, source, positions)
+        shuffled = np.take_along_axis(decks, source, axis=1)
+        decks[active] = shuffled[active]
+
+        # Deal player, dealer, player, dealer
+        player_hard = np.zeros(num_games, dtype=np.int16)
+        player_aces = np.zeros(num_games, dtype=np.int16)
+        dealer_hard = np.zeros(num_games, dtype=np.int16)
+        dealer_aces = np.zeros(num_games, dtype=np.int16)
+        for i in range(4):
+            card = decks[games, np.minimum(cursor + i, deck_size - 1)]
+            if i % 2 == 0:
+                player_hard += card_values[card]
+                player_aces += card_aces[card]
+            else:
+                dealer_hard += card_values[card]
+                dealer_aces += card_aces[card]
+        cursor = np.where(active, cursor + 4, cursor)
+
+        # Each hand hits until it reaches its threshold or the deck is empty
+        for hard, aces, stand in [(player_hard, player_aces, threshold), \
+            (dealer_hard, dealer_aces, 17)]:
+            hitting = active & (score(hard, aces) < stand) \
+                & (cursor < deck_size)
+            while hitting.any():
+                card = decks[games, np.minimum(cursor, deck_size - 1)]
+                hard += np.where(hitting, card_values[card], 0)
+                aces += hitting & card_aces[card]
+                cursor += hitting
+                hitting &= (score(hard, aces) < stand) & (cursor < deck_size)
+
+        result = determine_winner(score(player_hard, player_aces), \
+            score(dealer_hard, dealer_aces))
+        won = active & (result == 1)
+        lost = active & (result == -1)
+        money = money + np.where(won, bet, 0) - np.where(lost, bet, 0)
+        bet = bet + np.where(won, 5, 0) - np.where(lost & (bet > 5), 5, 0)
+
+        outcomes[:, r] = np.where(active, result, NOT_PLAYED)
+        wallets[:, r] = money
+
+    return outcomes, wallets
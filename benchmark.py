@@ -0,0 +1,176 @@
+"""
+Benchmarks for the shuffles, dealing, scoring and full Blackjack sessions.
+
+Run the suite and save a baseline:
+    python benchmark.py run --output baseline.json
+Run it again and flag anything slower than the baseline:
+    python benchmark.py compare baseline.json --tolerance 0.1
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+from timeit import Timer
+
+import numpy as np
+
+from blackjack import Blackjack
+from card import Card
+from deck import Deck, Shoe
+from hand import PlayerHand
+from shuffle import Shuffle
+
+deck_sizes = [1, 2, 6, 8]
+round_counts = [10, 100, 1000]
+
+
+def time_per_call(function, number, repeat=5):
+    """
+    Returns the best time in seconds of one call to `function`, over
+    `repeat` runs of `number` calls.
+    """
+    return min(Timer(function).repeat(repeat=repeat, number=number)) / number
+
+
+def bench_shuffles(results):
+    for num_decks in deck_sizes:
+        cards = Card.all_cards() * num_decks
+        for num in [1, 5]:
+            results['mongean/decks={}/num={}'.format(num_decks, num)] = \
+                time_per_call(lambda: Shuffle.mongean(cards, num), 1000)
+            results['modified_overhand/decks={}/num={}' \
+                .format(num_decks, num)] = \
+                time_per_call(lambda: Shuffle.modified_overhand(cards, num), \
+                1000)
+
+    # Per-deck cost of shuffling 1000 decks at once
+    decks = np.tile(np.arange(52), (1000, 1))
+    counts = np.arange(1000) % 6
+    results['batch_shuffle/decks=1000'] = time_per_call(lambda: \
+        Shuffle.batch_mongean(Shuffle.batch_modified_overhand(decks, counts), \
+        counts), 20) / 1000
+
+
+def bench_deck(results):
+    for num_decks in deck_sizes:
+        if num_decks == 1:
+            deck = Deck()
+        else:
+            deck = Shoe(num_decks)
+        results['deck_shuffle/decks={}'.format(num_decks)] = time_per_call( \
+            lambda: deck.shuffle(modified_overhand=3, mongean=4), 1000)
+
+        def deal():
+            if num_decks == 1:
+                dealt = Deck()
+            else:
+                dealt = Shoe(num_decks, penetration=1)
+            for i in range(dealt.cards_left() // 2):
+                dealt.deal_hand(PlayerHand())
+        results['deal_hand/decks={}'.format(num_decks)] = \
+            time_per_call(deal, 20) / (52 * num_decks // 2)
+
+
+def bench_scoring(results):
+    hand = PlayerHand()
+    hand.add_card(Card('A', 'spades'), Card(5, 'hearts'), Card(9, 'clubs'))
+    results['calculate_score'] = time_per_call( \
+        lambda: Blackjack.calculate_score(hand), 100000)
+
+    game = Blackjack(100, deck=Shoe(6), summaries=False, record_log=False)
+
+    def hit():
+        # Keep cards in the shoe so every call really deals
+        if game.deck.cards_left() < 52:
+            game.deck.reshuffle()
+        game.hit_or_stand(PlayerHand(), 17)
+    results['hit_or_stand'] = time_per_call(hit, 10000)
+
+
+def bench_sessions(results):
+    # A single Deck runs out after a few rounds, so every size is a Shoe
+    for num_decks in deck_sizes:
+        for num_rounds in round_counts:
+            for summaries in [False, True]:
+                def session():
+                    game = Blackjack(10 ** 9, deck=Shoe(num_decks), \
+                        summaries=summaries)
+                    game.play_round(num_rounds, 17)
+                    game.close()
+                results['play_round/decks={}/rounds={}/summaries={}' \
+                    .format(num_decks, num_rounds, summaries)] = \
+                    time_per_call(session, max(1, 1000 // num_rounds), \
+                    repeat=3)
+
+
+def run_all():
+    """
+    Runs every benchmark and returns a dictionary mapping benchmark names
+    to seconds per call. Sessions write their summaries to a temporary
+    directory.
+    """
+    results = {}
+    bench_shuffles(results)
+    bench_deck(results)
+    bench_scoring(results)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.mkdir(os.path.join(directory, 'game_summaries'))
+        os.chdir(directory)
+        try:
+            bench_sessions(results)
+        finally:
+            os.chdir(cwd)
+
+    return results
+
+
+def compare_results(baseline, current, tolerance):
+    """
+    Returns (name, baseline, current) for every benchmark that is more than
+    `tolerance` (a fraction) slower than in the baseline.
+
+    >>> compare_results({'a': 1.0, 'b': 1.0, 'c': 1.0}, \\
+    ...     {'a': 1.05, 'b': 1.5, 'd': 9.0}, 0.1)
+    [('b', 1.0, 1.5)]
+    """
+    return [(name, baseline[name], current[name]) for name in sorted(current) \
+        if name in baseline and current[name] > baseline[name] * (1 + tolerance)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Blackjack benchmarks.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='run and print the benchmarks')
+    run.add_argument('--output', help='save the results as a JSON baseline')
+    compare = commands.add_parser('compare', \
+        help='run the benchmarks and compare them to a JSON baseline')
+    compare.add_argument('baseline')
+    compare.add_argument('--tolerance', type=float, default=0.1, \
+        help='allowed slowdown as a fraction (default 0.1)')
+    args = parser.parse_args(argv)
+
+    results = run_all()
+    for name in sorted(results):
+        print('{:45} {:12.3f} us'.format(name, results[name] * 1e6))
+
+    if args.command == 'run':
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_results(baseline, results, args.tolerance)
+    for name, before, after in regressions:
+        print('REGRESSION {}: {:.3f} us -> {:.3f} us'.format(name, \
+            before * 1e6, after * 1e6))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
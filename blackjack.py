@@ -1,10 +1,66 @@
+import os
+import sys
+from importlib.machinery import PathFinder
+
 from deck import Deck
 from hand import DealerHand, PlayerHand
 from card import Card
+from round_result import RoundResult
+from random import Random
+from threading import Lock
+
+
+class SeedingLoader:
+    """
+    Loader for numpy.random that runs numpy's own loader and then seeds
+    the module's global stream with 20. Anything else is looked up on
+    numpy's loader, which is left unchanged.
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        module.seed(20)
+
+
+class SeedOnImport:
+    """
+    Import hook that seeds numpy's global stream with 20 as soon as
+    numpy.random is first imported, by this module or any other. Games
+    and programs see the same stream as when this module imported numpy
+    and seeded it itself, and seeds they set afterwards still take
+    effect, but importing this module does not load numpy.
+    """
+
+    # Lets the hook be recognised when this file is loaded both as
+    # __main__ and as blackjack, which gives two SeedOnImport classes
+    seeds_numpy = True
 
-# don't change these imports
-from numpy.random import randint, seed
-seed(20)
+    def find_spec(self, name, path, target=None):
+        if name != 'numpy.random':
+            return None
+        sys.meta_path.remove(self)
+        spec = PathFinder.find_spec(name, path)
+        if spec is None or spec.loader is None:
+            return None
+
+        spec.loader = SeedingLoader(spec.loader)
+        return spec
+
+
+if 'numpy.random' in sys.modules:
+    sys.modules['numpy.random'].seed(20)
+elif not any(getattr(finder, 'seeds_numpy', False) \
+    for finder in sys.meta_path):
+    sys.meta_path.insert(0, SeedOnImport())
 
 class Blackjack:
     """
@@ -171,22 +227,103 @@ class Blackjack:
     >>> blackjack_4.play_round(1, 17)
     >>> print(blackjack_4.get_log())
     Not enough cards for a game.
+    >>> blackjack_4.get_results()
+    {1: 1, 0: 1, -1: 6}
+
+    >>> quiet = Blackjack(10, summaries=False, record_log=False)
+    >>> quiet.play_round(2, 17)
+    >>> quiet.get_log()
+    ''
+
+    >>> game_a = Blackjack(50, summaries=False, rng=7)
+    >>> game_b = Blackjack(50, summaries=False, rng=7)
+    >>> game_b.play_round(5, 16)
+    >>> game_a.play_round(5, 16)
+    >>> game_a.get_log() == game_b.get_log()
+    True
+    >>> children = game_a.spawn(2)
+    >>> game_c = Blackjack(50, summaries=False, rng=children[0])
+    >>> game_d = Blackjack(50, summaries=False, rng=children[1])
+    >>> game_c.play_round(5, 16)
+    >>> game_d.play_round(5, 16)
+    >>> game_c.get_log() == game_d.get_log()
+    False
+
+    >>> from instrument import Instrumentation
+    >>> timed = Blackjack(5, summaries=False, rng=1, \\
+    ...     instrumentation=Instrumentation())
+    >>> timed.play_round(20, 21)
+    >>> stats = timed.instrumentation.snapshot()
+    >>> stats['phases']['shuffle']['calls'] == stats['counters']['rounds']
+    True
+    >>> stats['counters']['aborted_no_money']
+    1
     """
     # Class Attribute(s)
     num_games = 1
+    # Games may be created and played from many threads at once
+    num_games_lock = Lock()
+    global_rng_lock = Lock()
+    # numpy's global randint, once it has been imported and seeded
+    global_randint = None
 
-    def __init__(self, wallet):
+    def __init__(self, wallet, deck=None, summaries=True, record_log=True, \
+        summary_options=None, summary_format='text', rng=None, \
+        instrumentation=None, summary_dir='./game_summaries'):
         # Initialize instance attributes
         # auto-increment as needed
+        # `deck` may be a Shoe to play a multi-deck game that reshuffles
+        # itself instead of running out of cards. Rounds are only written
+        # to the game summary file when `summaries` is True, and nothing
+        # is logged when `record_log` is False. `summary_options` are
+        # passed on to the SummaryWriter, e.g. flush_rounds, index,
+        # compression or max_rounds (see summary.py). With
+        # `summary_format` 'binary', rounds are written as compact
+        # records to game_summaryX.bin instead (see history.py).
+        # Summary files are written to `summary_dir`.
+        # Shuffle counts are drawn from the global numpy stream seeded
+        # with 20 unless `rng` is given, as an int or a SeedSequence, in
+        # which case the game owns its own Generator, or as a
+        # random.Random, which draws without numpy. `instrumentation`
+        # is an optional Instrumentation that times each phase of
+        # play_round (see instrument.py).
         assert isinstance(wallet, int) or isinstance(wallet, float)
+        assert isinstance(summaries, bool)
+        assert isinstance(record_log, bool)
+        assert summary_format in ['text', 'binary']
 
-        self.deck = Deck()
+        if deck is None:
+            deck = Deck()
+        self.deck = deck
         self.wallet = wallet
         self.bet = 5
-        self.game_number = Blackjack.num_games
-        Blackjack.num_games += 1
-        self.log = ''
+        with Blackjack.num_games_lock:
+            self.game_number = Blackjack.num_games
+            Blackjack.num_games += 1
+        # The log is kept as event tuples and only formatted by get_log()
+        self.events = []
+        self.record_log = record_log
         self.round = 1
+        self.summaries = summaries
+        self.summary_writer = None
+        if summary_options is None:
+            summary_options = {}
+        self.summary_options = summary_options
+        self.summary_format = summary_format
+        self.summary_dir = summary_dir
+        # Number of rounds won (1), tied (0) and lost (-1) by the player
+        self.results = {1: 0, 0: 0, -1: 0}
+        self.instrumentation = instrumentation
+        if rng is None or isinstance(rng, Random):
+            self.seed_seq = None
+            self.rng = rng
+        else:
+            from numpy.random import default_rng, SeedSequence
+            if isinstance(rng, SeedSequence):
+                self.seed_seq = rng
+            else:
+                self.seed_seq = SeedSequence(rng)
+            self.rng = default_rng(self.seed_seq)
 
     
     def play_round(self, num_rounds, stand_threshold):
@@ -197,58 +334,182 @@ class Blackjack:
             num_rounds (int): Number of rounds to play.
             stand_threshold (int): Score threshold for when the player
             will stand (ie player stands if they have a score >= 
-            this threshold)
+            this threshold), or a StrategyTable for the player to follow.
+
+        Buffered round summaries are flushed to the summary file before
+        returning. Compressed summaries are only made readable once every
+        `flush_interval` seconds (see `SummaryWriter.sync`), or on close.
+        """
+        for outcome in self.play_rounds(num_rounds, stand_threshold):
+            pass
+
+    def play_rounds(self, num_rounds, stand_threshold):
+        """
+        Plays up to `num_rounds` Blackjack rounds like `play_round`, but
+        yields a RoundResult after each one. Rounds are only played as
+        they are asked for, so callers may stop early. The game still
+        logs every round unless it was created with `record_log=False`,
+        which is needed to play any number of rounds in constant memory.
+        The bet is reset and the summaries are flushed once the generator
+        finishes or is closed.
+
+        >>> game = Blackjack(20, summaries=False, record_log=False, rng=3)
+        >>> rounds = game.play_rounds(1000, 17)
+        >>> first = next(rounds)
+        >>> first.round, first.bet
+        (1, 5)
+        >>> first.wallet - 20 == first.result * 5
+        True
+        >>> rounds.close()
+        >>> game.round
+        2
         """
         # This could get pretty long!
         min_cards = 4
         dealer_threshold = 17
+        # Phase timing only happens when the game was given instrumentation
+        inst = self.instrumentation
 
-        for r in range(num_rounds):
-            player = PlayerHand()
-            dealer = DealerHand()
-            if len(self.deck.get_cards()) < min_cards:
-                self.log += 'Not enough cards for a game.'
-                self.bet = 5
-                break
-            if self.wallet < self.bet:
-                self.log += 'Wallet amount ${} is less than bet amount ${}.'\
-                    .format(self.wallet, self.bet)
-                self.bet = 5
-                break
-            self.log += 'Round ' + str(self.round) + ' of Blackjack!\n'
-            self.log += 'wallet: ' + str(self.wallet) + '\n'
-            self.log += 'bet: ' + str(self.bet) + '\n'
-            mongean_shuffle_amount = randint(6)
-            modified_shuffle_amount = randint(6)
-            self.deck.shuffle(modified_overhand=modified_shuffle_amount, \
-                mongean=mongean_shuffle_amount)
-            self.deck.deal_hand(player)
-            self.deck.deal_hand(dealer)
-            self.deck.deal_hand(player)
-            self.deck.deal_hand(dealer)
-            self.log += 'Player Cards: ' + repr(player) + '\n' \
-                + 'Dealer Cards: ' + repr(dealer)  + '\n'
-
-            self.hit_or_stand(player, stand_threshold)
-            dealer.reveal_hand()
-            self.log += 'Dealer Cards Revealed: ' + repr(dealer) + '\n'
-            self.hit_or_stand(dealer, dealer_threshold)
-            player_score = Blackjack.calculate_score(player)
-            dealer_score = Blackjack.calculate_score(dealer)
-            result = self.determine_winner(player_score, \
-                dealer_score)
-            if result == 1:
-                self.wallet += self.bet
-                self.bet += 5
-            elif result == -1:
-                self.wallet -= self.bet
-                if self.bet > 5:
-                    self.bet -= 5
-            self.add_to_file(player, dealer, result)
-            self.round += 1
-        self.bet = 5
+        try:
+            for r in range(num_rounds):
+                player = PlayerHand()
+                dealer = DealerHand()
+                # A Shoe whose cut card came out last round reshuffles here
+                self.deck.prepare_round()
+                if self.deck.cards_left() < min_cards:
+                    if self.record_log:
+                        self.events.append(('no_cards',))
+                    if inst is not None:
+                        inst.count('aborted_no_cards')
+                    self.bet = 5
+                    break
+                if self.wallet < self.bet:
+                    if self.record_log:
+                        self.events.append(('no_money', self.wallet, self.bet))
+                    if inst is not None:
+                        inst.count('aborted_no_money')
+                    self.bet = 5
+                    break
+                if self.record_log:
+                    self.events.append(('round', self.round, self.wallet, \
+                        self.bet))
+                if inst is not None:
+                    start = inst.clock()
+                mongean_shuffle_amount, modified_shuffle_amount = \
+                    self.draw_shuffle_counts()
+                self.deck.shuffle(modified_overhand=modified_shuffle_amount, \
+                    mongean=mongean_shuffle_amount)
+                if inst is not None:
+                    end = inst.clock()
+                    inst.record('shuffle', start, end)
+                    start = end
+                self.deck.deal_hand(player)
+                self.deck.deal_hand(dealer)
+                self.deck.deal_hand(player)
+                self.deck.deal_hand(dealer)
+                if self.record_log:
+                    self.events.append(('deal', tuple(player.get_cards()), \
+                        tuple(dealer.get_cards())))
+                if inst is not None:
+                    end = inst.clock()
+                    inst.record('deal', start, end)
+                    start = end
+
+                self.hit_or_stand(player, stand_threshold, dealer.get_cards()[0])
+                if inst is not None:
+                    end = inst.clock()
+                    inst.record('player', start, end)
+                    start = end
+                dealer.reveal_hand()
+                if self.record_log:
+                    self.events.append(('reveal', tuple(dealer.get_cards())))
+                self.hit_or_stand(dealer, dealer_threshold)
+                if inst is not None:
+                    end = inst.clock()
+                    inst.record('dealer', start, end)
+                    start = end
+                player_score = player.get_score()
+                dealer_score = dealer.get_score()
+                if inst is not None:
+                    end = inst.clock()
+                    inst.record('score', start, end)
+                    start = end
+                result = self.determine_winner(player_score, \
+                    dealer_score)
+                if inst is not None:
+                    end = inst.clock()
+                    inst.record('winner', start, end)
+                stake = self.bet
+                if result == 1:
+                    self.wallet += self.bet
+                    self.bet += 5
+                elif result == -1:
+                    self.wallet -= self.bet
+                    if self.bet > 5:
+                        self.bet -= 5
+                self.results[result] += 1
+                if self.summaries:
+                    if inst is not None:
+                        start = inst.clock()
+                    self.add_to_file(player, dealer, result)
+                    if inst is not None:
+                        inst.record('summary', start, inst.clock())
+                if inst is not None:
+                    inst.count('rounds')
+                    inst.count('cards_dealt', len(player.get_cards()) + \
+                        len(dealer.get_cards()))
+                outcome = RoundResult(self.round, \
+                    tuple(player.get_cards()), tuple(dealer.get_cards()), \
+                    player_score, dealer_score, result, self.wallet, stake)
+                self.round += 1
+                yield outcome
+        finally:
+            self.bet = 5
+            self.flush_summaries()
 
             
+    def draw_shuffle_counts(self):
+        """
+        Returns the number of mongean and modified overhand shuffles for a
+        round, each from 0 to 5.
+        """
+        if self.rng is None:
+            # Keeps each game's pair of draws together across threads
+            with Blackjack.global_rng_lock:
+                randint = Blackjack.legacy_randint()
+                return randint(6), randint(6)
+        if self.seed_seq is None:
+            return self.rng.randrange(6), self.rng.randrange(6)
+        return self.rng.integers(6), self.rng.integers(6)
+
+    def legacy_randint():
+        """
+        Returns numpy's global randint, importing numpy the first time.
+        The global stream is seeded with 20 when numpy.random is imported
+        (see SeedOnImport), never here, so a seed set by the program
+        after importing this module is kept.
+
+        >>> import numpy as np
+        >>> np.random.seed(1)
+        >>> Blackjack(10, summaries=False).draw_shuffle_counts()
+        (5, 3)
+        """
+        if Blackjack.global_randint is None:
+            from numpy.random import randint
+            Blackjack.global_randint = randint
+
+        return Blackjack.global_randint
+
+    def spawn(self, n):
+        """
+        Returns `n` SeedSequences for independent random streams derived
+        from this game's stream. Pass them as `rng` to new games.
+        """
+        if self.seed_seq is None:
+            raise ValueError('This game has no SeedSequence; create it with '
+                'an int or SeedSequence rng to spawn streams.')
+        return self.seed_seq.spawn(n)
+
     def calculate_score(hand):
         """
         Calculates the score of a given hand. 
@@ -258,65 +519,53 @@ class Blackjack:
         Ace card is dependent on which value would bring the score closer
         (but not over) 21. 
 
-        Should be solved using list comprehension and map/filter. No explicit
-        for loops.
+        The hand keeps a running total as cards are added, so this only
+        reads it.
 
         Parameters:
             hand: The hand to calculate the score of.
         Returns:
             The best score as an integer value.
         """
-        change_to_10 = list(map(lambda x: 10 if x.get_rank() in ['J', 'Q', 'K'] else x.get_rank(), hand.get_cards()))
-        int_total = sum(list(filter(lambda x: type(x) == int, change_to_10)))
-        aces_total = len(list(filter(lambda x: x == 'A', change_to_10)))
-
-        if aces_total == 0:
-            return int_total
+        return hand.get_score()
 
-        if int_total + (11 + (aces_total - 1)) > 21:
-            int_total += aces_total
-        else:
-            int_total += 11 + (aces_total - 1)
-        
-        return int_total
 
-
-    def determine_winner(self, player_score, dealer_score):
+    def compare_scores(player_score, dealer_score):
         """
-        Determine whether the Blackjack round ended with a tie, dealer winning, 
-        or player winning. Update the log to include the winner and
-        their scores before returning.
-
-        Returns:
-            1 if the player won, 0 if it is a tie, and -1 if the dealer won
+        Returns 1 if the player won, 0 if it is a tie, and -1 if the dealer
+        won, without updating the log.
         """
         if player_score > 21 and dealer_score > 21:
-            self.log += 'Player and Dealer tie.\n'
             return 0
-
-        if player_score <= 21:
+        elif player_score <= 21:
             if dealer_score <= 21:
                 if dealer_score > player_score:
-                    self.log += 'Player lost with a score of {}. \
-Dealer won with a score of {}.\n'.format(player_score, dealer_score)
                     return -1
                 elif dealer_score == player_score:
-                    self.log += 'Player and Dealer tie.\n'
                     return 0
                 else:
-                    self.log += 'Player won with a score of {}. \
-Dealer lost with a score of {}.\n'.format(player_score, dealer_score)
                     return 1
             else:
-                self.log += 'Player won with a score of {}. \
-Dealer lost with a score of {}.\n'.format(player_score, dealer_score)
                 return 1
         else:
-            self.log += 'Player lost with a score of {}. \
-Dealer won with a score of {}.\n'.format(player_score, dealer_score)
             return -1
 
-    def hit_or_stand(self, hand, stand_threshold):
+    def determine_winner(self, player_score, dealer_score):
+        """
+        Determine whether the Blackjack round ended with a tie, dealer winning, 
+        or player winning. Update the log to include the winner and
+        their scores before returning.
+
+        Returns:
+            1 if the player won, 0 if it is a tie, and -1 if the dealer won
+        """
+        result = Blackjack.compare_scores(player_score, dealer_score)
+
+        if self.record_log:
+            self.events.append(('result', result, player_score, dealer_score))
+        return result
+
+    def hit_or_stand(self, hand, stand_threshold, up_card=None):
         """
         Deals cards to hand until the hand score has reached or surpassed
         the `stand_threshold`. Updates the log everytime a card is pulled.
@@ -325,51 +574,189 @@ Dealer won with a score of {}.\n'.format(player_score, dealer_score)
             hand: The hand the deal the cards to depending on its score.
             stand_threshold: Score threshold for when the player
             will stand (ie player stands if they have a score >= 
-            this threshold).
+            this threshold). May also be a StrategyTable (see
+            strategy.py), which is asked whether to hit instead.
+            up_card: The dealer's face-up card, used by a StrategyTable.
         """
-        
-        while Blackjack.calculate_score(hand) < stand_threshold and \
-            len(self.deck.get_cards()) > 0:
+        strategy = None
+        if hasattr(stand_threshold, 'should_hit'):
+            strategy = stand_threshold
+
+        while self.deck.cards_left() > 0:
+            if strategy is None:
+                if hand.get_score() >= stand_threshold:
+                    break
+            elif not strategy.should_hit(hand, up_card):
+                break
             if isinstance(hand, DealerHand):
                 participant = 'Dealer'
             else:
                 participant = 'Player'
-            rank = self.deck.get_cards()[0].get_rank()
-            suit = self.deck.get_cards()[0].get_suit()
+            top_card = self.deck.top_card()
             self.deck.deal_hand(hand)
-            self.log += '({}, {}) was pulled by a {}\n'.format(rank, suit, participant)
+            if self.record_log:
+                self.events.append(('pull', top_card, participant))
 
 
+    def render_event(event):
+        """
+        Returns the log text of an event recorded by `play_round`,
+        `hit_or_stand` or `determine_winner`.
+        """
+        kind = event[0]
+        if kind == 'round':
+            return 'Round {} of Blackjack!\nwallet: {}\nbet: {}\n' \
+                .format(*event[1:])
+        elif kind == 'deal':
+            player_cards, dealer_cards = event[1:]
+            dealer_repr = [repr(dealer_cards[0])] + \
+                [Card.hidden_repr] * (len(dealer_cards) - 1)
+            return 'Player Cards: ' + ' '.join(map(repr, player_cards)) + \
+                '\nDealer Cards: ' + ' '.join(dealer_repr) + '\n'
+        elif kind == 'pull':
+            card, participant = event[1:]
+            return '({}, {}) was pulled by a {}\n'.format(card.get_rank(), \
+                card.get_suit(), participant)
+        elif kind == 'reveal':
+            return 'Dealer Cards Revealed: ' + ' '.join(map(repr, event[1])) \
+                + '\n'
+        elif kind == 'result':
+            result, player_score, dealer_score = event[1:]
+            if result == 0:
+                return 'Player and Dealer tie.\n'
+            elif result == 1:
+                return 'Player won with a score of {}. \
+Dealer lost with a score of {}.\n'.format(player_score, dealer_score)
+            else:
+                return 'Player lost with a score of {}. \
+Dealer won with a score of {}.\n'.format(player_score, dealer_score)
+        elif kind == 'no_cards':
+            return 'Not enough cards for a game.'
+        else:
+            return 'Wallet amount ${} is less than bet amount ${}.' \
+                .format(*event[1:])
+
     def get_log(self):
-        return self.log
+        return ''.join(map(Blackjack.render_event, self.events))
+
+    def get_results(self):
+        return self.results
     
     def reset_log(self):
-        self.log = ''
+        self.events = []
         
         
     def add_to_file(self, player_hand, dealer_hand, result):
         """
         Writes the summary and outcome of a round of Blackjack to the 
         corresponding .txt file. This file should be named game_summaryX.txt 
-        where X is the game number and it should be in `game_summaries` 
-        directory.
+        where X is the game number and it should be in the `summary_dir`
+        directory (`game_summaries` by default).
+
+        The file is kept open by a SummaryWriter for the life of the game,
+        which buffers rounds until it is flushed.
         """
-        
-        # Remember to use encoding = "utf-8"
-        with open('./game_summaries/game_summary' + str(self.game_number) + \
-            '.txt', 'a', encoding='utf-8') as f:
-            f.write('ROUND ' + str(self.round) + ':\n')
-            f.write('Player Hand:\n')
-            f.write(str(player_hand) + '\n')
-            f.write('Dealer Hand:\n')
-            f.write(str(dealer_hand) + '\n')
-            if result == -1:
-                f.write('Winner of ROUND ' + str(self.round) \
-                    + ': Dealer\n\n')
-            if result == 1:
-                f.write('Winner of ROUND ' + str(self.round) \
-                    + ': Player\n\n')
-            if result == 0:
-                f.write('Winner of ROUND ' + str(self.round) \
-                    + ': Tied\n\n')
+        if self.summary_writer is None:
+            # Only games that write summaries load the writers
+            from summary import SummaryWriter
+            from history import HistoryWriter
+            path = self.summary_dir + '/game_summary' + str(self.game_number)
+            if self.summary_format == 'binary':
+                self.summary_writer = HistoryWriter(path + '.bin', \
+                    **self.summary_options)
+            else:
+                self.summary_writer = SummaryWriter(path + '.txt', \
+                    **self.summary_options)
+
+        self.summary_writer.write_round(self.round, player_hand, \
+            dealer_hand, result)
+
+    def flush_summaries(self):
+        """
+        Writes any buffered rounds to the game summary file, so it can be
+        read even while compressed.
+        """
+        if self.summary_writer is not None:
+            self.summary_writer.sync()
+
+    def close(self):
+        """
+        Flushes and closes the game summary file.
+        """
+        if self.summary_writer is not None:
+            self.summary_writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+
+def main(argv=None):
+    """
+    Plays one game from the command line:
+        python -m blackjack --wallet 100 --rounds 10 --threshold 17
+
+    >>> main(['--wallet', '20', '--rounds', '3', '--seed', '4', \\
+    ...     '--format', 'json', '--no-summaries']) # doctest: +ELLIPSIS
+    {"game": ..., "rounds": 3, "wallet": 25, "won": 1, "tied": 2, "lost": 0}
+    0
+    """
+    # Only the command line needs these, so importing the game skips them
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(prog='python -m blackjack', \
+        description='Play a game of Blackjack.')
+    parser.add_argument('--wallet', type=int, default=100)
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--threshold', type=int, default=17, \
+        help='score at which the player stands (default 17)')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--generator', choices=['stdlib', 'numpy', \
+        'legacy'], default='stdlib', help='random.Random (default), a '
+        'numpy Generator, or the global numpy stream seeded with 20')
+    parser.add_argument('--format', choices=['text', 'json'], \
+        default='text', help='print the game log or a JSON result')
+    parser.add_argument('--summary-dir', default='./game_summaries')
+    parser.add_argument('--no-summaries', action='store_true', \
+        help='do not write a game summary file')
+    args = parser.parse_args(argv)
+
+    if args.generator == 'legacy':
+        if args.seed is not None:
+            parser.error('the legacy generator is always seeded with 20')
+        rng = None
+    elif args.generator == 'numpy':
+        rng = args.seed
+        if rng is None:
+            from numpy.random import SeedSequence
+            rng = SeedSequence()
+    else:
+        rng = Random(args.seed)
+
+    if not args.no_summaries:
+        os.makedirs(args.summary_dir, exist_ok=True)
+
+    with Blackjack(args.wallet, summaries=not args.no_summaries, \
+        record_log=args.format == 'text', rng=rng, \
+        summary_dir=args.summary_dir) as game:
+        game.play_round(args.rounds, args.threshold)
+
+    results = game.get_results()
+    if args.format == 'json':
+        print(json.dumps({'game': game.game_number, 'rounds': \
+            sum(results.values()), 'wallet': game.wallet, 'won': results[1], \
+            'tied': results[0], 'lost': results[-1]}))
+    else:
+        print(game.get_log())
+        print('Wallet: {}  Won: {}  Tied: {}  Lost: {}'.format(game.wallet, \
+            results[1], results[0], results[-1]))
+
+    return 0
+
 
+if __name__ == '__main__':
+    sys.exit(main())
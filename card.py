@@ -53,9 +53,31 @@ class Card:
     |__A|
     >>> card_3
     (A, diamonds)
+
+    # Doctests for the shared cards
+    >>> cards = Card.all_cards()
+    >>> len(cards)
+    52
+    >>> cards[0], cards[-1]
+    ((2, spades), (A, clubs))
+    >>> Card.from_code(51) is cards[-1]
+    True
+    >>> Card.all_cards()[0] is cards[0]
+    True
+    >>> card_1.get_code()
+    48
     """
 
     # Class Attribute(s)
+    __slots__ = ('rank', 'suit', 'visible', 'code', 'value')
+
+    ranks = [2, 3, 4, 5, 6, 7, 8, 9, 10, 'J', 'Q', 'K', 'A']
+    suits = ['spades', 'hearts', 'diamonds', 'clubs']
+
+    symbols = {'hearts': '♥', 'spades': '♠', 'clubs': '♣', 'diamonds': '♦'}
+
+    hidden_art = '____\n|?  |\n| ? |\n|__?|'
+    hidden_repr = '(?, ?)'
 
     def __init__(self, rank, suit, visible=True):
         """
@@ -76,17 +98,22 @@ class Card:
         assert isinstance(visible, bool)
         self.visible = visible
 
+        # The code orders cards by rank, then by suit, so it doubles as
+        # the sort key.
+        self.code = Card.ranks.index(rank) * len(Card.suits) + \
+            Card.suits.index(suit)
 
-    def __lt__(self, other_card):
-        ranks = [2, 3, 4, 5, 6, 7, 8, 9, 10, 'J', 'Q', 'K', 'A']
-        suits = ['spades', 'hearts','diamonds', 'clubs']
-        if self.get_rank() == other_card.get_rank():
-            return suits.index(self.get_suit()) < \
-                suits.index(other_card.get_suit())
-
+        # Aces count as 1 here; hands add 10 for an ace when it fits.
+        if rank == 'A':
+            self.value = 1
+        elif rank in ['J', 'Q', 'K']:
+            self.value = 10
         else:
-            return ranks.index(self.get_rank()) < \
-                ranks.index(other_card.get_rank())
+            self.value = rank
+
+
+    def __lt__(self, other_card):
+        return self.code < other_card.code
 
 
     def __str__(self):
@@ -104,23 +131,10 @@ class Card:
         | ? |
         |__?|             
         """
-        
-        if self.suit == 'hearts':
-            symbol = '♥'
-        elif self.suit == 'spades':
-            symbol = '♠'
-        elif self.suit == 'clubs':
-            symbol = '♣'
-        else:
-            symbol = '♦'
-        
         if self.visible:
-            card = '____\n|{0}  |\n| {1} |\n|__{0}|'\
-                .format(self.get_rank(), symbol)
+            return Card._art[self.code]
         else:
-            card = '____\n|?  |\n| ? |\n|__?|'
-
-        return card
+            return Card.hidden_art
 
     def __repr__(self):
         """
@@ -128,9 +142,9 @@ class Card:
         put in place of the actual rank and suit.           
         """
         if self.visible:
-            return '({}, {})'.format(self.get_rank(), self.get_suit())
+            return Card._reprs[self.code]
         else:
-            return '(?, ?)'
+            return Card.hidden_repr
 
     def get_rank(self):
         return self.rank
@@ -138,7 +152,43 @@ class Card:
     def get_suit(self):
         return self.suit
 
-    def set_visible(self, visible):
+    def get_code(self):
+        return self.code
 
+    def get_value(self):
+        return self.value
+
+    def set_visible(self, visible):
+        # The shared cards dealt from every deck are never hidden; hands
+        # keep track of which of their cards are face down instead.
         assert isinstance(visible, bool)
+        assert Card._cards[self.code] is not self
         self.visible = visible
+
+    def render_art(rank, suit):
+        """
+        Returns the ASCII art of a visible card.
+        """
+        return '____\n|{0}  |\n| {1} |\n|__{0}|'.format(rank, \
+            Card.symbols[suit])
+
+    def from_code(code):
+        """
+        Returns the shared card numbered `code`, where cards are numbered
+        0 to 51 in ascending order.
+        """
+        return Card._cards[code]
+
+    def all_cards():
+        """
+        Returns a new list of the 52 shared cards in ascending order.
+        """
+        return list(Card._cards)
+
+
+# The art and repr of every card are rendered once, indexed by code.
+Card._art = tuple(Card.render_art(r, s) for r in Card.ranks \
+    for s in Card.suits)
+Card._reprs = tuple('({}, {})'.format(r, s) for r in Card.ranks \
+    for s in Card.suits)
+Card._cards = tuple(Card(r, s) for r in Card.ranks for s in Card.suits)
@@ -0,0 +1,108 @@
+dealer_threshold = 17
+
+
+def composition(cards):
+    """
+    Returns the number of cards of each blackjack value in `cards`, as a
+    tuple indexed by value - 1 (aces first, ten-valued cards last). Suits
+    and the ranks 10, J, Q and K never change a score, so cards that only
+    differ by them are counted together.
+
+    >>> from deck import Deck
+    >>> composition(Deck().get_cards())
+    (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+    """
+    counts = [0] * 10
+    for c in cards:
+        counts[c.get_value() - 1] += 1
+
+    return tuple(counts)
+
+
+def deck_composition(deck):
+    """
+    Returns the composition of the cards left in `deck`, which may be a
+    Deck, a Shoe or a list of cards. Decks keep count of their ranks, so
+    their cards are not scanned.
+
+    >>> from deck import Shoe
+    >>> deck_composition(Shoe(2))
+    (8, 8, 8, 8, 8, 8, 8, 8, 8, 32)
+    """
+    if isinstance(deck, list):
+        return composition(deck)
+
+    # Ranks run 2 to 10, J, Q, K, A
+    ranks = deck.get_composition()
+    return (ranks[12],) + tuple(ranks[:8]) + (sum(ranks[8:12]),)
+
+
+def best_score(hard_total, num_aces):
+    """
+    Returns the score of a hand from its hard total and number of aces,
+    as `PlayerHand.get_score` does.
+    """
+    if num_aces > 0 and hard_total + 10 <= 21:
+        return hard_total + 10
+    return hard_total
+
+
+def final_scores(counts, hard_total, num_aces, stand_threshold, memo=None):
+    """
+    Returns ((score, probability), ...) for the final score of a hand that
+    keeps hitting from a deck with composition `counts` until it reaches
+    `stand_threshold` or the deck runs out, as `Blackjack.hit_or_stand`
+    does. Results for every state reached are kept in the dictionary
+    `memo`, which callers may pass to reuse them across calls; without
+    one they only last for this call.
+    """
+    if memo is None:
+        memo = {}
+    key = (counts, hard_total, num_aces, stand_threshold)
+    if key in memo:
+        return memo[key]
+
+    score = best_score(hard_total, num_aces)
+    total = sum(counts)
+    if score >= stand_threshold or total == 0:
+        memo[key] = ((score, 1.0),)
+        return memo[key]
+
+    distribution = {}
+    for i, count in enumerate(counts):
+        if count == 0:
+            continue
+        remaining = counts[:i] + (count - 1,) + counts[i + 1:]
+        for s, p in final_scores(remaining, hard_total + i + 1, \
+            num_aces + (i == 0), stand_threshold, memo):
+            distribution[s] = distribution.get(s, 0) + p * count / total
+
+    memo[key] = tuple(sorted(distribution.items()))
+    return memo[key]
+
+
+def dealer_distribution(up_card, deck):
+    """
+    Returns a dictionary mapping each final dealer score to its exact
+    probability, given the dealer's face-up card and the cards left in
+    `deck` (a Deck, a Shoe or a list of cards). The hole card is drawn
+    from `deck` first, then the dealer hits until reaching 17.
+
+    >>> from deck import Deck
+    >>> from hand import DealerHand
+    >>> deck = Deck()
+    >>> dealer = DealerHand()
+    >>> deck.deal_hand(dealer)
+    >>> up_card = dealer.get_cards()[0]
+    >>> up_card
+    (2, spades)
+    >>> odds = dealer_distribution(up_card, deck)
+    >>> round(sum(odds.values()), 10)
+    1.0
+    >>> [round(odds[s], 4) for s in range(17, 22)]
+    [0.139, 0.1318, 0.1318, 0.1239, 0.1205]
+    >>> round(sum(p for s, p in odds.items() if s > 21), 4)
+    0.353
+    """
+    return dict(final_scores(deck_composition(deck), up_card.get_value(), \
+        int(up_card.get_value() == 1), dealer_threshold))
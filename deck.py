@@ -17,19 +17,50 @@ class Deck:
     >>> deck.deal_hand(hand)
     >>> deck.get_cards()[0]
     (Q, spades)
+
+    # Doctests for the composition and counts
+    >>> deck.get_composition()
+    [4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 3]
+    >>> deck.get_running_count()
+    -1
+    >>> deck.deal_hand(hand)
+    >>> deck.deal_hand(hand)
+    >>> deck.get_composition()[10:]
+    [3, 4, 3]
+    >>> deck.get_running_count()
+    -3
+    >>> round(deck.get_true_count(), 2)
+    -3.18
     """
 
     # Class Attribute(s)
+    # Hi-Lo count of each rank: +1 for 2-6, 0 for 7-9, -1 for 10-A
+    hi_lo = [1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1]
+    cards_per_deck = 52
 
     def __init__(self):
         """
         Creates a Deck instance containing cards sorted in ascending order.
         """
-        ranks = [2, 3, 4, 5, 6, 7, 8, 9, 10, 'J', 'Q', 'K', 'A']
-        suits = ['spades', 'hearts','diamonds', 'clubs']
-        
-        self.cards = [Card(r, s) for r in ranks for s in suits]
+        self.cards = Card.all_cards()
+        self.reset_counts(1)
 
+    def reset_counts(self, num_decks):
+        """
+        Resets the composition and the running count to those of
+        `num_decks` full decks.
+        """
+        # Cards left of each rank, in the order of Card.ranks
+        self.rank_counts = [len(Card.suits) * num_decks] * len(Card.ranks)
+        self.running_count = 0
+
+    def count_card(self, card):
+        """
+        Updates the composition and the running count for a dealt card.
+        """
+        rank = card.code // len(Card.suits)
+        self.rank_counts[rank] -= 1
+        self.running_count += Deck.hi_lo[rank]
 
     def shuffle(self, **shuffle_and_count):
         """Shuffles the deck using a variety of different shuffles.
@@ -41,16 +72,30 @@ class Deck:
         """
         assert isinstance(shuffle_and_count, dict)
 
+        self.cards = Deck.shuffle_cards(self.cards, shuffle_and_count)
+
+    def shuffle_cards(cards, shuffle_and_count):
+        """
+        Returns `cards` shuffled by the shuffles named in the
+        `shuffle_and_count` dictionary.
+        """
         if 'modified_overhand' in shuffle_and_count:
-            self.cards = Shuffle.modified_overhand(self.cards, \
+            cards = Shuffle.modified_overhand(cards, \
                 shuffle_and_count['modified_overhand'])
 
         if 'mongean' in shuffle_and_count:
             number_mongean = shuffle_and_count['mongean']
-            while number_mongean > 0:
-                self.cards = Shuffle.mongean(self.cards)
-                number_mongean -= 1
-            
+            if number_mongean > 0:
+                cards = Shuffle.mongean(cards, number_mongean)
+
+        return cards
+
+    def prepare_round(self):
+        """
+        Called before each round is dealt. A single deck is never
+        reshuffled, so there is nothing to do.
+        """
+        pass
 
     def deal_hand(self, hand):
         """
@@ -58,8 +103,155 @@ class Deck:
         """
         assert isinstance(hand, PlayerHand) or isinstance(hand, DealerHand)
         
-        hand.add_card(self.get_cards()[0])
-        self.cards.remove(self.get_cards()[0])
+        card = self.cards.pop(0)
+        self.count_card(card)
+        hand.add_card(card)
 
     def get_cards(self):
         return self.cards
+
+    def cards_left(self):
+        return len(self.cards)
+
+    def top_card(self):
+        return self.cards[0]
+
+    def get_composition(self):
+        """
+        Returns the number of cards left of each rank, in the order of
+        `Card.ranks`.
+        """
+        return list(self.rank_counts)
+
+    def get_running_count(self):
+        """
+        Returns the Hi-Lo running count of the cards dealt so far.
+        """
+        return self.running_count
+
+    def get_true_count(self):
+        """
+        Returns the running count per deck left to deal.
+        """
+        if self.cards_left() == 0:
+            return 0.0
+        return self.running_count * Deck.cards_per_deck / self.cards_left()
+
+
+class Shoe(Deck):
+    """
+    Shoe of `num_decks` decks dealt by advancing a cursor over a fixed list
+    of cards. Once the cursor reaches the cut card, placed after
+    `penetration` of the shoe, the round in play is finished and then
+    every card is collected and the shoe is reshuffled with `reshuffle`
+    (the same keyword arguments as `Deck.shuffle`), before the next round
+    is shuffled or dealt.
+
+    >>> shoe = Shoe(2, penetration=0.5)
+    >>> shoe.cards_left()
+    104
+    >>> shoe.get_cards()[:3]
+    [(2, spades), (2, spades), (2, hearts)]
+    >>> hand = PlayerHand()
+    >>> for i in range(51):
+    ...     shoe.deal_hand(hand)
+    >>> shoe.cards_left()
+    53
+    >>> shoe.top_card()
+    (8, hearts)
+    >>> shoe.get_running_count()
+    40
+    >>> shoe.get_true_count()
+    39.24528301886792
+    >>> shoe.deal_hand(hand)
+    >>> shoe.cards_left()
+    52
+    >>> shoe.prepare_round()
+    >>> shoe.cards_left()
+    104
+    >>> shoe.get_running_count()
+    0
+    >>> shoe.get_cards()[:3]
+    [(K, spades), (9, spades), (3, spades)]
+
+    # Cards on the table are never dealt again in the same round
+    >>> from blackjack import Blackjack
+    >>> game = Blackjack(10 ** 6, deck=Shoe(1), summaries=False, \\
+    ...     record_log=False, rng=5)
+    >>> repeats = 0
+    >>> for outcome in game.play_rounds(500, 17):
+    ...     cards = outcome.player_cards + outcome.dealer_cards
+    ...     repeats += len(set(cards)) != len(cards)
+    >>> repeats, game.round
+    (0, 501)
+    """
+
+    def __init__(self, num_decks=6, penetration=0.75, **reshuffle):
+        """
+        Creates a Shoe of `num_decks` decks sorted in ascending order.
+        """
+        assert isinstance(num_decks, int) and num_decks > 0
+        assert 0 < penetration <= 1
+
+        super().__init__()
+        self.cards = [c for c in self.cards for d in range(num_decks)]
+        self.num_decks = num_decks
+        self.reset_counts(num_decks)
+        self.cursor = 0
+        self.cut = int(len(self.cards) * penetration)
+        # Set once the cut card is dealt; the shoe is reshuffled between
+        # rounds, never while cards are on the table
+        self.cut_reached = False
+        if reshuffle:
+            self.reshuffle_counts = reshuffle
+        else:
+            self.reshuffle_counts = {'modified_overhand': 5, 'mongean': 5}
+
+    def shuffle(self, **shuffle_and_count):
+        """
+        Shuffles the cards that have not been dealt yet.
+        """
+        assert isinstance(shuffle_and_count, dict)
+
+        self.prepare_round()
+        self.cards[self.cursor:] = Deck.shuffle_cards( \
+            self.cards[self.cursor:], shuffle_and_count)
+
+    def reshuffle(self):
+        """
+        Collects every card back into the shoe and shuffles it.
+        """
+        self.cursor = 0
+        self.cut_reached = False
+        self.cards = Deck.shuffle_cards(self.cards, self.reshuffle_counts)
+        self.reset_counts(self.num_decks)
+
+    def prepare_round(self):
+        """
+        Reshuffles the shoe if the cut card was dealt in an earlier round.
+        """
+        if self.cut_reached:
+            self.reshuffle()
+
+    def deal_hand(self, hand):
+        """
+        Deals the card under the cursor to `hand`. Dealing the cut card
+        only marks the shoe for a reshuffle before the next round.
+        """
+        assert isinstance(hand, PlayerHand) or isinstance(hand, DealerHand)
+
+        card = self.cards[self.cursor]
+        self.count_card(card)
+        hand.add_card(card)
+        self.cursor += 1
+        if self.cursor >= self.cut:
+            self.cut_reached = True
+
+    def get_cards(self):
+        return self.cards[self.cursor:]
+
+    def cards_left(self):
+        return len(self.cards) - self.cursor
+
+    def top_card(self):
+        return self.cards[self.cursor]
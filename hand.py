@@ -1,3 +1,5 @@
+from bisect import insort
+
 from card import Card
 
 class PlayerHand():
@@ -67,53 +69,72 @@ class PlayerHand():
     |__K|
     >>> d_hand
     (4, hearts) (5, spades) (K, diamonds)
+
+    # Doctests for get_score()
+    >>> p_hand.get_score()
+    16
+    >>> p_hand.add_card(card_6)
+    >>> p_hand.get_score()
+    16
+    >>> d_hand.get_score()
+    19
     """
     
     def __init__(self):
         self.cards = []
+        self.hard_total = 0
+        self.num_aces = 0
         
     def add_card(self, *cards):
         """
-        Adds cards to the hand, then sorts
-        them in ascending order.
+        Adds cards to the hand, inserting each one
+        where it keeps the hand in ascending order.
         """
         assert all([isinstance(i, Card) for i in cards])
 
         for c in cards:
-            self.cards.append(c)
+            insort(self.cards, c)
+            self.count_card(c)
 
-        self.sort_hand()
+    def count_card(self, card):
+        """
+        Adds `card` to the running hard total and ace count.
+        """
+        self.hard_total += card.value
+        if card.value == 1:
+            self.num_aces += 1
 
     def get_cards(self):
         return self.cards      
 
+    def get_score(self):
+        """
+        Returns the best score of the hand. One ace counts as 11 when
+        that does not take the score over 21.
+        """
+        if self.num_aces > 0 and self.hard_total + 10 <= 21:
+            return self.hard_total + 10
+        return self.hard_total
+
     def __str__(self):
         """
         Returns the string representation of all cards
         in the hand, with each card on a new line.
         """
-        card_str = ''
-        for c in self.get_cards():
-            card_str += str(c) + '\n'
-
-        return card_str.strip()
+        return '\n'.join(map(str, self.cards))
     
     def __repr__(self):
         """
         Returns the representation of all cards, with 
         each card separated by a space.
         """
-        card_repr = ''
-        for c in self.get_cards():
-            card_repr += repr(c) + ' '
-
-        return card_repr.strip()
+        return ' '.join(map(repr, self.cards))
 
     def sort_hand(self):
         """
         Sorts the cards in ascending order.
         """
-        self.cards = sorted(self.cards)
+        self.cards.sort(key=Card.get_code)
 
     
 class DealerHand(PlayerHand):
@@ -138,8 +159,7 @@ class DealerHand(PlayerHand):
         else:
             for c in cards:
                 self.cards.append(c)
-                c.set_visible(False)
-            self.cards[0].set_visible(True)
+                self.count_card(c)
 
     
     def reveal_hand(self):
@@ -148,7 +168,26 @@ class DealerHand(PlayerHand):
         and sorts them in ascending order.
         """
         self.hand_visible = True
-        for c in self.cards:
-            c.set_visible(True)
-        
-        self.sort_hand()
\ No newline at end of file
+        self.sort_hand()
+
+    def __str__(self):
+        """
+        Returns the string representation of all cards in the hand, with
+        every card but the first hidden until the hand is revealed.
+        """
+        if self.hand_visible or not self.cards:
+            return PlayerHand.__str__(self)
+
+        return '\n'.join([str(self.cards[0])] + \
+            [Card.hidden_art] * (len(self.cards) - 1))
+
+    def __repr__(self):
+        """
+        Returns the representation of all cards in the hand, with every
+        card but the first hidden until the hand is revealed.
+        """
+        if self.hand_visible or not self.cards:
+            return PlayerHand.__repr__(self)
+
+        return ' '.join([repr(self.cards[0])] + \
+            [Card.hidden_repr] * (len(self.cards) - 1))
\ No newline at end of file
@@ -0,0 +1,144 @@
+from struct import Struct
+
+from card import Card
+from hand import PlayerHand
+from mapped import MappedFile
+from summary import SummaryWriter
+
+# Most cards a hand can hold when it stands at 21 or below
+max_cards = 21
+
+# Round number, result, number of player and dealer cards, then the card
+# codes of each hand padded to `max_cards` bytes.
+record = Struct('<IbBB{0}s{0}s'.format(max_cards))
+
+
+def pack_round(round_number, player_codes, dealer_codes, result):
+    """
+    Returns the fixed-width record of a round.
+
+    >>> data = pack_round(3, [0, 51], [12, 20, 30], -1)
+    >>> len(data) == record.size
+    True
+    >>> unpack_round(data)
+    (3, (0, 51), (12, 20, 30), -1)
+    """
+    if len(player_codes) > max_cards or len(dealer_codes) > max_cards:
+        raise ValueError('A hand holds more than {} cards.'.format(max_cards))
+
+    return record.pack(round_number, result, len(player_codes), \
+        len(dealer_codes), bytes(player_codes), bytes(dealer_codes))
+
+
+def unpack_round(data, offset=0):
+    """
+    Returns (round number, player codes, dealer codes, result) from the
+    record starting at `offset` in `data`.
+    """
+    round_number, result, num_player, num_dealer, player, dealer = \
+        record.unpack_from(data, offset)
+
+    return round_number, tuple(player[:num_player]), \
+        tuple(dealer[:num_dealer]), result
+
+
+class HistoryWriter(SummaryWriter):
+    """
+    Writes rounds as fixed-width binary records instead of the card art of
+    game_summaryX.txt, with the same buffering as SummaryWriter.
+
+    >>> from os import remove
+    >>> player = PlayerHand()
+    >>> player.add_card(Card('A', 'spades'), Card('K', 'hearts'))
+    >>> dealer = PlayerHand()
+    >>> dealer.add_card(Card(9, 'clubs'), Card(8, 'clubs'))
+    >>> with HistoryWriter('history_doctest.bin') as writer:
+    ...     for r in range(1, 4):
+    ...         writer.write_round(r, player, dealer, r - 2)
+
+    >>> with HistoryReader('history_doctest.bin') as reader:
+    ...     len(reader)
+    ...     reader.get_round(2)
+    ...     print(reader.render(2))
+    3
+    (3, (45, 48), (27, 31), 1)
+    ROUND 3:
+    Player Hand:
+    ____
+    |K  |
+    | ♥ |
+    |__K|
+    ____
+    |A  |
+    | ♠ |
+    |__A|
+    Dealer Hand:
+    ____
+    |8  |
+    | ♣ |
+    |__8|
+    ____
+    |9  |
+    | ♣ |
+    |__9|
+    Winner of ROUND 3: Player
+    <BLANKLINE>
+    <BLANKLINE>
+    >>> remove('history_doctest.bin')
+    """
+
+    empty = b''
+
+    def encode_round(self, round_number, player_hand, dealer_hand, result):
+        return pack_round(round_number, \
+            [c.get_code() for c in player_hand.get_cards()], \
+            [c.get_code() for c in dealer_hand.get_cards()], result)
+
+    def data_size(self, data):
+        return len(data)
+
+    def open_file(self):
+        return SummaryWriter.open_path(self.segment_path(), 'ab', \
+            self.compression)
+
+
+class HistoryReader(MappedFile):
+    """
+    Reads a file written by HistoryWriter through a memory map, so any
+    round can be read without parsing the rounds before it.
+    """
+
+    def __len__(self):
+        return len(self.data) // record.size
+
+    def get_round(self, index):
+        """
+        Returns (round number, player codes, dealer codes, result) of the
+        `index`th round in the file.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError('Round index {} out of range.'.format(index))
+
+        return unpack_round(self.data, index * record.size)
+
+    def render(self, start=0, stop=None):
+        """
+        Returns the game summary text of the rounds from index `start` up
+        to, but not including, index `stop`, exactly as add_to_file writes
+        it.
+        """
+        if stop is None:
+            stop = len(self)
+
+        text = []
+        for index in range(start, min(stop, len(self))):
+            round_number, player_codes, dealer_codes, result = \
+                self.get_round(index)
+            player = PlayerHand()
+            player.add_card(*map(Card.from_code, player_codes))
+            dealer = PlayerHand()
+            dealer.add_card(*map(Card.from_code, dealer_codes))
+            text.append(SummaryWriter.format_round(round_number, player, \
+                dealer, result))
+
+        return ''.join(text)
@@ -0,0 +1,34 @@
+from mmap import mmap, ACCESS_READ
+
+
+class MappedFile:
+    """
+    Read-only memory map of a whole file, kept open until `close`. An
+    empty file is read as empty bytes, since it cannot be mapped.
+
+    >>> from os import remove
+    >>> with open('mapped_doctest.bin', 'wb') as f:
+    ...     f.write(b'abcdef')
+    6
+    >>> with MappedFile('mapped_doctest.bin') as mapped:
+    ...     mapped.data[2:4]
+    b'cd'
+    >>> remove('mapped_doctest.bin')
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.data = b''
+        if self.file.seek(0, 2) > 0:
+            self.data = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+
+    def close(self):
+        if isinstance(self.data, mmap):
+            self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,37 @@
+class RoundResult:
+    """
+    Outcome of one round of Blackjack, as yielded by
+    `Blackjack.play_rounds`.
+
+    `result` is 1 if the player won, 0 for a tie and -1 if the dealer won.
+    `bet` is the amount that was at stake and `wallet` is the player's
+    wallet once the round was settled.
+
+    >>> from card import Card
+    >>> outcome = RoundResult(3, (Card(10, 'spades'), Card(9, 'hearts')), \\
+    ...     (Card(7, 'clubs'), Card('K', 'clubs')), 19, 17, 1, 25, 10)
+    >>> outcome
+    RoundResult(round=3, player_score=19, dealer_score=17, result=1, wallet=25, bet=10)
+    >>> outcome.player_cards
+    ((10, spades), (9, hearts))
+    """
+
+    __slots__ = ('round', 'player_cards', 'dealer_cards', 'player_score', \
+        'dealer_score', 'result', 'wallet', 'bet')
+
+    def __init__(self, round, player_cards, dealer_cards, player_score, \
+        dealer_score, result, wallet, bet):
+        self.round = round
+        self.player_cards = player_cards
+        self.dealer_cards = dealer_cards
+        self.player_score = player_score
+        self.dealer_score = dealer_score
+        self.result = result
+        self.wallet = wallet
+        self.bet = bet
+
+    def __repr__(self):
+        return 'RoundResult(round={}, player_score={}, dealer_score={}, ' \
+            'result={}, wallet={}, bet={})'.format(self.round, \
+            self.player_score, self.dealer_score, self.result, self.wallet, \
+            self.bet)
@@ -0,0 +1,244 @@
+"""
+Asyncio server hosting many concurrent Blackjack tables.
+
+Each TCP connection is one table. Clients send one command per line:
+    JOIN <wallet>            start a table with a starting wallet
+    PLAY <stand_threshold>   play one round and receive its log
+    WALLET                   receive the current wallet and bet
+    QUIT                     close the table
+Replies are the round log followed by a line starting with OK, or a
+single line starting with ERR.
+
+    python server.py --port 8020
+"""
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy.random import SeedSequence
+
+from blackjack import Blackjack
+from deck import Shoe
+
+
+class BlackjackServer:
+    """
+    Serves Blackjack tables over a line-based TCP protocol. Rounds are
+    played in a thread pool, so summary file I/O never blocks the event
+    loop. A table stops reading commands until its replies have drained,
+    so a slow client only holds up its own table. Every table deals from
+    its own Shoe of `num_decks` decks, reshuffled once `penetration` of it
+    has been dealt, so tables can play round after round.
+
+    >>> async def session(commands):
+    ...     server = BlackjackServer(port=0, summaries=False, entropy=20)
+    ...     await server.start()
+    ...     reader, writer = await asyncio.open_connection('127.0.0.1', \\
+    ...         server.port)
+    ...     replies = []
+    ...     for command in commands:
+    ...         writer.write(command.encode() + b'\\n')
+    ...         while True:
+    ...             line = (await reader.readline()).decode().rstrip('\\n')
+    ...             replies.append(line)
+    ...             if line.startswith(('OK', 'ERR')):
+    ...                 break
+    ...     writer.close()
+    ...     await server.stop()
+    ...     return replies
+    >>> replies = asyncio.run(session(['PLAY 17', 'JOIN 10', 'PLAY 17', \\
+    ...     'WALLET', 'QUIT']))
+    >>> replies[0]
+    'ERR join a table first'
+    >>> replies[1]
+    'OK table 1'
+    >>> replies[2]
+    'Round 1 of Blackjack!'
+    >>> replies[-2].startswith('OK wallet')
+    True
+    >>> replies[-1]
+    'OK bye'
+
+    >>> replies = asyncio.run(session(['JOIN 1000000'] + ['PLAY 17'] * 40))
+    >>> sum(line.startswith('Round ') for line in replies)
+    40
+    >>> any(line.startswith('Not enough cards') for line in replies)
+    False
+    """
+
+    def __init__(self, host='127.0.0.1', port=8020, max_tables=10000, \
+        workers=32, summaries=True, entropy=None, write_limit=65536, \
+        num_decks=6, penetration=0.75):
+        self.host = host
+        self.port = port
+        self.max_tables = max_tables
+        self.summaries = summaries
+        self.write_limit = write_limit
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        # Every table draws from its own stream spawned from this one
+        self.seed_seq = SeedSequence(entropy)
+        self.tables = 0
+        self.server = None
+        self.handlers = set()
+        # Tables still being closed after their client left
+        self.closing = set()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, self.host, \
+            self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def stop(self):
+        """
+        Stops accepting clients, closes every table and waits for their
+        summaries to be written.
+        """
+        self.server.close()
+        for handler in self.handlers:
+            handler.cancel()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        await asyncio.gather(*self.closing, return_exceptions=True)
+        await self.server.wait_closed()
+        self.executor.shutdown(wait=True)
+
+    async def run(self, function, *args):
+        """
+        Runs a blocking call in the thread pool.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def handle(self, reader, writer):
+        """
+        Serves one table until the client quits or disconnects.
+        """
+        writer.transport.set_write_buffer_limits(high=self.write_limit)
+        handler = asyncio.current_task()
+        self.handlers.add(handler)
+        game = None
+        # The round running in the thread pool, if any
+        pending = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                words = line.decode('utf-8', 'replace').split()
+                if not words:
+                    continue
+                command = words[0].upper()
+
+                if command == 'QUIT':
+                    writer.write(b'OK bye\n')
+                    await writer.drain()
+                    break
+                elif command == 'JOIN':
+                    if game is not None:
+                        reply = 'ERR already at a table'
+                    elif self.tables >= self.max_tables:
+                        reply = 'ERR no free tables'
+                    elif len(words) != 2 or not words[1].isdigit():
+                        reply = 'ERR usage: JOIN <wallet>'
+                    else:
+                        game = Blackjack(int(words[1]), \
+                            deck=Shoe(self.num_decks, self.penetration), \
+                            summaries=self.summaries, \
+                            rng=self.seed_seq.spawn(1)[0])
+                        self.tables += 1
+                        reply = 'OK table {}'.format(game.game_number)
+                elif game is None:
+                    reply = 'ERR join a table first'
+                elif command == 'PLAY':
+                    if len(words) != 2 or not words[1].isdigit():
+                        reply = 'ERR usage: PLAY <stand_threshold>'
+                    else:
+                        loop = asyncio.get_running_loop()
+                        pending = loop.run_in_executor(self.executor, \
+                            game.play_round, 1, int(words[1]))
+                        # Cancelling the handler must not abandon a round
+                        # that is still being played
+                        try:
+                            await asyncio.shield(pending)
+                        except OSError as error:
+                            game.reset_log()
+                            reply = 'ERR could not play: {}'.format( \
+                                error.strerror or error)
+                            writer.write(reply.encode('utf-8') + b'\n')
+                            await writer.drain()
+                            continue
+                        log = game.get_log()
+                        game.reset_log()
+                        if log and not log.endswith('\n'):
+                            log += '\n'
+                        writer.write(log.encode('utf-8'))
+                        reply = 'OK wallet {} bet {}'.format(game.wallet, \
+                            game.bet)
+                elif command == 'WALLET':
+                    reply = 'OK wallet {} bet {}'.format(game.wallet, \
+                        game.bet)
+                else:
+                    reply = 'ERR unknown command ' + command
+
+                writer.write(reply.encode('utf-8') + b'\n')
+                # Wait for slow clients before reading their next command
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # stop() cancels tables that are still connected; they close
+            # below like any other table
+            pass
+        finally:
+            self.handlers.discard(handler)
+            writer.close()
+            if game is not None:
+                self.tables -= 1
+                closing = asyncio.ensure_future(self.close_table(game, \
+                    pending))
+                self.closing.add(closing)
+                closing.add_done_callback(self.closing.discard)
+
+    async def close_table(self, game, pending):
+        """
+        Closes `game` once its last round, the `pending` future, has
+        finished. Closing flushes the summary file, so it also runs in the
+        thread pool.
+        """
+        if pending is not None:
+            await asyncio.wait([pending])
+        try:
+            await self.run(game.close)
+        except OSError:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Blackjack table server.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8020)
+    parser.add_argument('--max-tables', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument('--no-summaries', action='store_true', \
+        help='do not write game summary files')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--decks', type=int, default=6, \
+        help='decks in each table\'s shoe (default 6)')
+    parser.add_argument('--penetration', type=float, default=0.75, \
+        help='fraction of the shoe dealt before it is reshuffled')
+    args = parser.parse_args(argv)
+
+    server = BlackjackServer(args.host, args.port, args.max_tables, \
+        args.workers, not args.no_summaries, args.seed, \
+        num_decks=args.decks, penetration=args.penetration)
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,6 @@
+from math import lcm
+
+
 class Shuffle:
     """
     Different kinds of shuffling techniques.
@@ -21,8 +24,52 @@ class Shuffle:
     >>> mod_oh_even = Shuffle.modified_overhand(odd_cards, 2)
     >>> mod_oh_even
     [1, 2, 3, 4, 5]
-    """     
-        
+
+    # Doctests for the cached permutation tables
+    >>> Shuffle.mongean(cards, 3) == \\
+    ...     Shuffle.mongean(Shuffle.mongean(Shuffle.mongean(cards)))
+    True
+    >>> Shuffle.mongean(cards, 12) == cards
+    True
+    >>> Shuffle.mongean(cards, 25) == Shuffle.mongean(cards)
+    True
+    >>> big = list(range(2934))
+    >>> Shuffle.mongean(Shuffle.mongean(big, 2933)) == big
+    True
+    >>> Shuffle.permutation(5, 'modified_overhand', 2)
+    (0, 1, 2, 3, 4)
+    >>> Shuffle.apply(['a', 'b', 'c'], (2, 0, 1))
+    ['c', 'a', 'b']
+
+    # Doctests for large shoes
+    >>> shoe = [i for i in range(52 * 40)]
+    >>> Shuffle.mongean(shoe)[:3]
+    [2079, 2077, 2075]
+    >>> Shuffle.modified_overhand(shoe, 5)[:6]
+    [1025, 1027, 1028, 1029, 1030, 1031]
+
+    # Doctests for batched shuffles
+    >>> import numpy as np
+    >>> decks = np.tile(np.arange(52), (4, 1))
+    >>> counts = np.array([0, 1, 3, 5])
+    >>> batch = Shuffle.batch_modified_overhand(decks, counts)
+    >>> all(batch[i].tolist() == Shuffle.modified_overhand(cards, counts[i]) \\
+    ...     for i in range(4))
+    True
+    >>> batch = Shuffle.batch_mongean(batch, counts)
+    >>> batch[1].tolist() == Shuffle.mongean(mod_oh, 1)
+    True
+    >>> Shuffle.batch_mongean(decks)[:, 0]
+    array([51, 51, 51, 51])
+    """
+
+    # Class Attribute(s)
+    # Maps (deck size, shuffle name, count) to a tuple of indices.
+    _permutations = {}
+
+    # Maps deck size to the number of mongean shuffles that restore it.
+    _mongean_orders = {}
+
     def modified_overhand(cards, num):
         """
         Takes `num` cards from the middle of the deck and puts them at the
@@ -31,63 +78,175 @@ class Shuffle:
         When num is odd, the "extra" card is taken from the bottom of the
         top half of the deck.
         """
-        
-        # Use Recursion.
+        return Shuffle.apply(cards, \
+            Shuffle.permutation(len(cards), 'modified_overhand', num))
+
+    def mongean(cards, num=1):
+        """
+        Implements the mongean shuffle `num` times.
+        Check wikipedia for technique description. Doing it 12 times restores the deck.
+        """
+        return Shuffle.apply(cards, \
+            Shuffle.permutation(len(cards), 'mongean', num))
+
+    def batch_modified_overhand(decks, nums):
+        """
+        Applies `modified_overhand` to every row of the 2-D array `decks`,
+        with the count for each row taken from `nums` (one int for every
+        row, or an array with one count per row).
+        """
+        return Shuffle.batch_apply(decks, 'modified_overhand', nums)
+
+    def batch_mongean(decks, nums=1):
+        """
+        Applies `mongean` to every row of the 2-D array `decks`, with the
+        count for each row taken from `nums` as in
+        `batch_modified_overhand`.
+        """
+        return Shuffle.batch_apply(decks, 'mongean', nums)
+
+    def apply(cards, permutation):
+        """
+        Returns a new list where position i holds `cards[permutation[i]]`.
+        """
+        return [cards[i] for i in permutation]
+
+    def batch_apply(decks, shuffle, nums):
+        """
+        Returns a new array holding each row of `decks` shuffled by
+        `shuffle` with its count from `nums`. The cached permutation of
+        every distinct count is stacked into one table, so all rows are
+        gathered in a single numpy operation.
+        """
+        # numpy is only needed for batches, so plain shuffles never load it
+        import numpy as np
+
+        decks = np.asarray(decks)
+        assert decks.ndim == 2
+        num_decks, size = decks.shape
+        nums = np.broadcast_to(np.asarray(nums, dtype=np.int64), \
+            (num_decks,))
+        if shuffle == 'mongean':
+            nums = nums % Shuffle.mongean_order(size)
+
+        counts, rows = np.unique(nums, return_inverse=True)
+        table = np.array([Shuffle.permutation(size, shuffle, num) \
+            for num in counts], dtype=np.intp).reshape(len(counts), size)
+
+        return np.take_along_axis(decks, table[rows.reshape(-1)], axis=1)
+
+    def permutation(size, shuffle, num):
+        """
+        Returns the permutation of a deck of `size` cards produced by
+        `shuffle` ('modified_overhand' or 'mongean') with count `num`.
+
+        Permutations are computed once and cached. Repeated mongean
+        shuffles are reduced by the order of the shuffle and composed into
+        a single permutation by repeated squaring, so any count costs the
+        same as one once cached.
+        """
+        assert shuffle in ['modified_overhand', 'mongean']
+
+        num = int(num)
+        if shuffle == 'mongean':
+            num = num % Shuffle.mongean_order(size)
+
+        key = (size, shuffle, num)
+        if key not in Shuffle._permutations:
+            if shuffle == 'modified_overhand':
+                perm = Shuffle._modified_overhand(list(range(size)), num)
+            else:
+                # Powers of one permutation commute, so the order in which
+                # they are composed does not matter
+                perm = list(range(size))
+                step = Shuffle._mongean(list(range(size)))
+                while num > 0:
+                    if num % 2 == 1:
+                        perm = Shuffle.apply(perm, step)
+                    step = Shuffle.apply(step, step)
+                    num //= 2
+            Shuffle._permutations[key] = tuple(perm)
+
+        return Shuffle._permutations[key]
+
+    def mongean_order(size):
+        """
+        Returns the smallest number of mongean shuffles that restores a
+        deck of `size` cards to its original order: the least common
+        multiple of the lengths of the shuffle's cycles.
+        """
+        if size not in Shuffle._mongean_orders:
+            step = Shuffle._mongean(list(range(size)))
+            seen = [False] * size
+            order = 1
+            for start in range(size):
+                length = 0
+                i = start
+                while not seen[i]:
+                    seen[i] = True
+                    i = step[i]
+                    length += 1
+                if length > 0:
+                    order = lcm(order, length)
+            Shuffle._mongean_orders[size] = order
+
+        return Shuffle._mongean_orders[size]
+
+    def _modified_overhand(cards, num):
+        """
+        Builds the modified overhand shuffle of `cards` by slicing, one
+        pass per value of `num` from `num` down to 1.
+        """
         # Note that the top of the deck is the card at index 0.
         half = 2
-
-        if num == 0:
-            return cards
-        
         halfway = len(cards) // half
-        top = cards[:halfway]
-
-        if len(cards) % 2 == 0:
-            amount_remove = num // half
-            bottom = cards[halfway:]
-            bottom_removed = bottom[:amount_remove]
-            bottom_keep = bottom[amount_remove:]
-            if num % 2 == 0:
-                top_removed = top[-amount_remove:]
-                top_keep = top[:-amount_remove]
-            else:
-                top_removed = top[-(amount_remove+1):]
-                top_keep = top[:-(amount_remove+1)]
-            cards = top_removed + bottom_removed + \
-                top_keep + bottom_keep
-        else:
-            amount_remove = (num - 1) // half
-            bottom = cards[halfway+1:]
-            middle = [cards[halfway]]
-            bottom_removed = bottom[:amount_remove]
-            bottom_keep = bottom[amount_remove:]
-            if num % 2 != 0:
-                if num == 1:
-                    top_removed = []
-                    top_keep = top
-                else:
+
+        while num > 0:
+            top = cards[:halfway]
+
+            if len(cards) % 2 == 0:
+                amount_remove = num // half
+                bottom = cards[halfway:]
+                bottom_removed = bottom[:amount_remove]
+                bottom_keep = bottom[amount_remove:]
+                if num % 2 == 0:
                     top_removed = top[-amount_remove:]
                     top_keep = top[:-amount_remove]
+                else:
+                    top_removed = top[-(amount_remove+1):]
+                    top_keep = top[:-(amount_remove+1)]
+                cards = top_removed + bottom_removed + \
+                    top_keep + bottom_keep
             else:
-                top_removed = top[-(amount_remove+1):]
-                top_keep = top[:-(amount_remove+1)]
-            cards = top_removed + middle+ bottom_removed + \
-                top_keep + bottom_keep
+                amount_remove = (num - 1) // half
+                bottom = cards[halfway+1:]
+                middle = [cards[halfway]]
+                bottom_removed = bottom[:amount_remove]
+                bottom_keep = bottom[amount_remove:]
+                if num % 2 != 0:
+                    if num == 1:
+                        top_removed = []
+                        top_keep = top
+                    else:
+                        top_removed = top[-amount_remove:]
+                        top_keep = top[:-amount_remove]
+                else:
+                    top_removed = top[-(amount_remove+1):]
+                    top_keep = top[:-(amount_remove+1)]
+                cards = top_removed + middle + bottom_removed + \
+                    top_keep + bottom_keep
+
+            num -= 1
 
-        return Shuffle.modified_overhand(cards, num-1)
-                
-    def mongean(cards):
+        return cards
+
+    def _mongean(cards):
         """
-        Implements the mongean shuffle. 
-        Check wikipedia for technique description. Doing it 12 times restores the deck.
+        Builds a single mongean shuffle of `cards`.
+
+        Dealing the cards in order, every second card goes on top of the
+        new pile and the others go underneath, which leaves the odd
+        positions reversed on top of the even positions.
         """
-        
         # Remember that the "top" of the deck is the first item in the list.
-        # Use Recursion. Can use helper functions.
-        
-        if len(cards) == 0:
-            return cards
-        elif len(cards) % 2 == 0:
-            return [cards[-1]] + Shuffle.mongean(cards[:-1])
-        elif len(cards) % 2 != 0:
-            return Shuffle.mongean(cards[:-1]) + [cards[-1]]
+        return cards[1::2][::-1] + cards[0::2]
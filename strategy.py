@@ -0,0 +1,173 @@
+import json
+
+from blackjack import Blackjack
+from dealer_odds import best_score, deck_composition, dealer_threshold, \
+    final_scores
+from deck import Deck
+
+
+def stand_ev(counts, player_score, up_value, dealer_memo=None):
+    """
+    Returns the expected result of standing on `player_score` against a
+    dealer showing a card of value `up_value`, where the hole card and the
+    dealer's hits come from a deck with composition `counts`. Results are
+    scored as `Blackjack.determine_winner` does: 1 for a win, 0 for a tie
+    and -1 for a loss. `dealer_memo` is passed on to `final_scores`.
+    """
+    dealer = final_scores(counts, up_value, int(up_value == 1), \
+        dealer_threshold, dealer_memo)
+
+    return sum(p * Blackjack.compare_scores(player_score, s) \
+        for s, p in dealer)
+
+
+def hit_stand_ev(counts, hard_total, num_aces, up_value, memo=None, \
+    dealer_memo=None):
+    """
+    Returns (stand, hit) expected results for a player hand with
+    `hard_total` and `num_aces` against a dealer up-card of `up_value`,
+    with the remaining cards given by `counts` (see
+    `dealer_odds.composition`). After hitting, the player keeps playing
+    the better of the two. A player over 21 can only stand. hit is None
+    when the deck is empty.
+
+    Solved states are kept in the dictionaries `memo` (the player's) and
+    `dealer_memo` (see `final_scores`), which callers may pass to reuse
+    them across calls; without them they only last for this call.
+
+    >>> from dealer_odds import composition
+    >>> counts = composition(Deck().get_cards())
+    >>> stand, hit = hit_stand_ev(counts, 20, 0, 10)
+    >>> round(stand, 4), round(hit, 4)
+    (0.4352, -0.6562)
+    >>> stand, hit = hit_stand_ev(counts, 12, 0, 10)
+    >>> stand < hit
+    True
+    """
+    if memo is None:
+        memo = {}
+    if dealer_memo is None:
+        dealer_memo = {}
+    key = (counts, hard_total, num_aces, up_value)
+    if key in memo:
+        return memo[key]
+
+    score = best_score(hard_total, num_aces)
+    stand = stand_ev(counts, score, up_value, dealer_memo)
+    total = sum(counts)
+    if score > 21 or total == 0:
+        memo[key] = (stand, None)
+        return memo[key]
+
+    hit = 0
+    for i, count in enumerate(counts):
+        if count == 0:
+            continue
+        remaining = counts[:i] + (count - 1,) + counts[i + 1:]
+        next_stand, next_hit = hit_stand_ev(remaining, hard_total + i + 1, \
+            num_aces + (i == 0), up_value, memo, dealer_memo)
+        if next_hit is not None and next_hit > next_stand:
+            hit += next_hit * count / total
+        else:
+            hit += next_stand * count / total
+
+    memo[key] = (stand, hit)
+    return memo[key]
+
+
+def solve(player_hand, up_card, deck):
+    """
+    Returns (stand, hit) expected results for `player_hand` against the
+    dealer's `up_card`, given the cards left in `deck` (a Deck, a Shoe or
+    a list of cards).
+    """
+    return hit_stand_ev(deck_composition(deck), player_hand.hard_total, \
+        player_hand.num_aces, up_card.get_value())
+
+
+class StrategyTable:
+    """
+    Table of whether the player should hit, for every hard total, soft or
+    hard hand and dealer up-card value, solved for one deck composition.
+    Pass a table as the `stand_threshold` of `Blackjack.play_round` to have
+    the player follow it.
+
+    >>> from os import remove
+    >>> from card import Card
+    >>> from hand import PlayerHand
+    >>> # A deck without 2s, 3s and aces solves in well under a second
+    >>> table = StrategyTable.build(Deck().get_cards()[8:48])
+    >>> hand = PlayerHand()
+    >>> hand.add_card(Card(10, 'spades'), Card(6, 'hearts'))
+    >>> table.should_hit(hand, Card('K', 'clubs'))
+    True
+    >>> table.should_hit(hand, Card(6, 'clubs'))
+    False
+    >>> game = Blackjack(100, summaries=False)
+    >>> game.play_round(3, table)
+    >>> sum(game.get_results().values())
+    3
+    >>> table.save('strategy_doctest.json')
+    >>> StrategyTable.load('strategy_doctest.json').hit == table.hit
+    True
+    >>> remove('strategy_doctest.json')
+    """
+
+    def __init__(self, hit):
+        # Maps (hard total, soft, up-card value) to True to hit
+        self.hit = hit
+
+    def build(deck=None):
+        """
+        Solves the table for the cards in `deck` (a full Deck by default;
+        a Shoe or a list of cards also work). Each dealer up-card is taken
+        out of the deck before solving; the player's own cards are not
+        known to the table and stay in. Solving a full deck takes about a
+        minute, so tables are meant to be saved and loaded. The solved
+        states are shared by every entry of the table and dropped once it
+        is built.
+        """
+        if deck is None:
+            deck = Deck()
+        counts = deck_composition(deck)
+        memo = {}
+        dealer_memo = {}
+
+        hit = {}
+        for up_value in range(1, 11):
+            if counts[up_value - 1] == 0:
+                continue
+            remaining = counts[:up_value - 1] + \
+                (counts[up_value - 1] - 1,) + counts[up_value:]
+            for hard_total in range(2, 22):
+                for soft in [False, True]:
+                    # Two cards make at least 4 unless one is an ace
+                    if hard_total < 4 and not soft:
+                        continue
+                    stand, hit_ev = hit_stand_ev(remaining, hard_total, \
+                        int(soft), up_value, memo, dealer_memo)
+                    hit[(hard_total, soft, up_value)] = \
+                        hit_ev is not None and hit_ev > stand
+
+        return StrategyTable(hit)
+
+    def should_hit(self, hand, up_card):
+        """
+        Returns whether `hand` should hit against the dealer's `up_card`.
+        """
+        return self.hit.get((hand.hard_total, hand.num_aces > 0, \
+            up_card.get_value()), False)
+
+    def save(self, path):
+        """
+        Writes the table to `path` as JSON.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump([[h, s, u, v] for (h, s, u), v in self.hit.items()], f)
+
+    def load(path):
+        """
+        Reads a table written by `save`.
+        """
+        with open(path, encoding='utf-8') as f:
+            return StrategyTable({(h, s, u): v for h, s, u, v in json.load(f)})
@@ -0,0 +1,419 @@
+from os.path import exists, getsize, splitext
+from threading import RLock
+from time import monotonic
+
+from summary_index import index_path, index_record
+
+
+class SummaryWriter:
+    """
+    Writes round summaries to a game summary file. The file is opened once
+    and kept open until `close`, and rounds are buffered in memory until
+    `flush_rounds` rounds are waiting or `flush_interval` seconds have
+    passed since the last flush. With `index` True, the byte offset and
+    winner of every round are also written to an index next to the file
+    (see summary_index.py).
+
+    Rounds may be written and flushed from several threads; each call
+    holds the writer's lock, so rounds are never interleaved.
+
+    `compression` ('gzip' or 'lzma') streams the file through a
+    compressor; compressed data is only readable up to the last `sync`
+    (at most once per `flush_interval`) or `close`. With `max_bytes` (bytes of summary before compression) or
+    `max_rounds`, the summary is split into numbered segments, so
+    game_summary1.txt is written as game_summary1.part0001.txt.gz,
+    game_summary1.part0002.txt.gz and so on. SummaryReader reads the
+    segments back as one stream.
+
+    >>> from os import remove
+    >>> from card import Card
+    >>> from hand import PlayerHand, DealerHand
+    >>> player = PlayerHand()
+    >>> player.add_card(Card('A', 'spades'), Card('K', 'hearts'))
+    >>> dealer = DealerHand()
+    >>> dealer.add_card(Card(9, 'clubs'), Card(8, 'clubs'))
+    >>> dealer.reveal_hand()
+
+    >>> with SummaryWriter('summary_doctest.txt', flush_rounds=2) as writer:
+    ...     writer.write_round(1, player, dealer, 1)
+    ...     writer.get_buffered()
+    ...     writer.write_round(2, player, dealer, 0)
+    ...     writer.get_buffered()
+    1
+    0
+    >>> with open('summary_doctest.txt', encoding='utf-8') as f:
+    ...     print(f.read())
+    ROUND 1:
+    Player Hand:
+    ____
+    |K  |
+    | ♥ |
+    |__K|
+    ____
+    |A  |
+    | ♠ |
+    |__A|
+    Dealer Hand:
+    ____
+    |8  |
+    | ♣ |
+    |__8|
+    ____
+    |9  |
+    | ♣ |
+    |__9|
+    Winner of ROUND 1: Player
+    <BLANKLINE>
+    ROUND 2:
+    Player Hand:
+    ____
+    |K  |
+    | ♥ |
+    |__K|
+    ____
+    |A  |
+    | ♠ |
+    |__A|
+    Dealer Hand:
+    ____
+    |8  |
+    | ♣ |
+    |__8|
+    ____
+    |9  |
+    | ♣ |
+    |__9|
+    Winner of ROUND 2: Tied
+    <BLANKLINE>
+    <BLANKLINE>
+    >>> remove('summary_doctest.txt')
+    """
+
+    winners = {-1: 'Dealer', 1: 'Player', 0: 'Tied'}
+    empty = ''
+    suffixes = {None: '', 'gzip': '.gz', 'lzma': '.xz'}
+
+    def __init__(self, path, flush_rounds=100, flush_interval=1.0, \
+        index=False, compression=None, max_bytes=None, max_rounds=None):
+        assert isinstance(flush_rounds, int) and flush_rounds > 0
+        assert isinstance(index, bool)
+        assert compression in SummaryWriter.suffixes
+        assert max_bytes is None or max_bytes > 0
+        assert max_rounds is None or max_rounds > 0
+        # Offsets are only meaningful in one uncompressed file
+        assert not index or (compression is None and max_bytes is None \
+            and max_rounds is None)
+
+        self.path = path
+        self.flush_rounds = flush_rounds
+        self.flush_interval = flush_interval
+        self.file = None
+        self.buffer = []
+        self.last_flush = monotonic()
+        self.last_sync = monotonic()
+        self.index = index
+        self.index_file = None
+        # (round number, result) of each buffered round, when indexing
+        self.index_buffer = []
+        self.offset = 0
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.max_rounds = max_rounds
+        self.part = 1
+        self.segment_bytes = 0
+        self.segment_rounds = 0
+        self.lock = RLock()
+
+    def format_round(round_number, player_hand, dealer_hand, result):
+        """
+        Returns the summary text of a round, as it is written to the game
+        summary file.
+        """
+        return 'ROUND ' + str(round_number) + ':\nPlayer Hand:\n' + \
+            str(player_hand) + '\nDealer Hand:\n' + str(dealer_hand) + \
+            '\nWinner of ROUND ' + str(round_number) + ': ' + \
+            SummaryWriter.winners[result] + '\n\n'
+
+    def write_round(self, round_number, player_hand, dealer_hand, result):
+        """
+        Buffers the summary of a round, flushing the buffer when it is
+        full or the flush interval has passed.
+        """
+        data = self.encode_round(round_number, player_hand, dealer_hand, \
+            result)
+        with self.lock:
+            self.buffer.append(data)
+            if self.index:
+                self.index_buffer.append((round_number, result))
+
+            if len(self.buffer) >= self.flush_rounds or \
+                monotonic() - self.last_flush >= self.flush_interval:
+                self.flush()
+
+    def encode_round(self, round_number, player_hand, dealer_hand, result):
+        return SummaryWriter.format_round(round_number, player_hand, \
+            dealer_hand, result)
+
+    def open_file(self):
+        # Remember to use encoding = "utf-8"
+        return SummaryWriter.open_path(self.segment_path(), 'at', \
+            self.compression)
+
+    def open_path(path, mode, compression):
+        """
+        Opens `path` in `mode` through the `compression` module, if any,
+        which is only imported once it is used. Text is UTF-8.
+        """
+        if compression == 'gzip':
+            import gzip
+            opener = gzip.open
+        elif compression == 'lzma':
+            import lzma
+            opener = lzma.open
+        else:
+            opener = open
+
+        if 'b' in mode:
+            return opener(path, mode)
+        return opener(path, mode, encoding='utf-8')
+
+    def segment_path(self):
+        """
+        Returns the path of the file currently being written.
+        """
+        path = self.path
+        if self.max_bytes is not None or self.max_rounds is not None:
+            base, extension = splitext(path)
+            path = '{}.part{:04d}{}'.format(base, self.part, extension)
+
+        return path + SummaryWriter.suffixes[self.compression]
+
+    def data_size(self, data):
+        """
+        Returns the number of bytes `data` takes up in the file.
+        """
+        return len(data.encode('utf-8'))
+
+    def get_buffered(self):
+        return len(self.buffer)
+
+    def flush(self):
+        """
+        Writes the buffered rounds to the file, opening it the first time.
+        """
+        with self.lock:
+            if self.buffer:
+                if self.max_bytes is None and self.max_rounds is None:
+                    self.write_data(self.empty.join(self.buffer))
+                else:
+                    for data in self.buffer:
+                        self.write_segment(data)
+                # Flushing a compressor would end its block early
+                if self.compression is None:
+                    self.file.flush()
+                if self.index:
+                    self.write_index()
+                self.buffer = []
+            self.last_flush = monotonic()
+
+    def sync(self):
+        """
+        Flushes the buffered rounds and, at most once every
+        `flush_interval` seconds, makes everything compressed so far
+        readable from the file. Syncing costs compression, so callers
+        that sync after every round still only do it once per interval.
+        A gzip stream is sync-flushed. An lzma stream cannot be, so it is
+        ended and the next write starts a new stream in the same file.
+        """
+        with self.lock:
+            self.flush()
+            if self.file is None or self.compression is None or \
+                monotonic() - self.last_sync < self.flush_interval:
+                return
+            if self.compression == 'gzip':
+                self.file.flush()
+            else:
+                self.file.close()
+                self.file = None
+            self.last_sync = monotonic()
+
+    def write_data(self, data):
+        """
+        Writes `data` to the file, opening it the first time.
+        """
+        if self.file is None:
+            self.file = self.open_file()
+            if self.index:
+                self.index_file = open(index_path(self.path), 'ab')
+                self.offset = getsize(self.path)
+        self.file.write(data)
+
+    def write_segment(self, data):
+        """
+        Writes the `data` of one round, moving on to the next segment
+        first if it would go over `max_rounds` or `max_bytes`.
+        """
+        size = 0
+        if self.max_bytes is not None:
+            size = self.data_size(data)
+        if self.segment_rounds > 0 and ((self.max_rounds is not None and \
+            self.segment_rounds >= self.max_rounds) or \
+            (self.max_bytes is not None and \
+            self.segment_bytes + size > self.max_bytes)):
+            self.file.close()
+            self.file = None
+            self.part += 1
+            self.segment_bytes = 0
+            self.segment_rounds = 0
+
+        self.write_data(data)
+        self.segment_bytes += size
+        self.segment_rounds += 1
+
+    def write_index(self):
+        """
+        Writes the index entries of the buffered rounds, which have just
+        been written to the file.
+        """
+        entries = []
+        for data, (round_number, result) in zip(self.buffer, \
+            self.index_buffer):
+            entries.append(index_record.pack(round_number, self.offset, \
+                result))
+            self.offset += self.data_size(data)
+        self.index_file.write(b''.join(entries))
+        self.index_file.flush()
+        self.index_buffer = []
+
+    def close(self):
+        """
+        Flushes the buffered rounds and closes the file.
+        """
+        with self.lock:
+            self.flush()
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+            if self.index_file is not None:
+                self.index_file.close()
+                self.index_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def summary_segments(path):
+    """
+    Returns the files written by a SummaryWriter for `path`, with or
+    without compression and segments, in the order they were written.
+    """
+    from glob import glob, escape
+
+    base, extension = splitext(path)
+    paths = [path + suffix for suffix in SummaryWriter.suffixes.values() \
+        if exists(path + suffix)]
+    parts = glob(escape(base) + '.part*' + escape(extension) + '*')
+
+    def part_number(part):
+        return int(part[len(base) + 5:].split('.', 1)[0])
+
+    return paths + sorted(parts, key=part_number)
+
+
+class SummaryReader:
+    """
+    Reads the text of a game summary written by SummaryWriter as one
+    stream, decompressing and chaining its segments as needed.
+
+    >>> from shutil import rmtree
+    >>> from tempfile import mkdtemp
+    >>> from blackjack import Blackjack
+    >>> directory = mkdtemp()
+    >>> with Blackjack(100, summary_dir=directory, rng=4) as plain:
+    ...     plain.play_round(5, 17)
+    >>> with Blackjack(100, summary_dir=directory, rng=4, \\
+    ...     summary_options={'compression': 'gzip', 'max_rounds': 2}) as game:
+    ...     game.play_round(5, 17)
+    >>> segments = summary_segments(game.summary_writer.path)
+    >>> [segment[-16:] for segment in segments]
+    ['.part0001.txt.gz', '.part0002.txt.gz', '.part0003.txt.gz']
+    >>> with SummaryReader(game.summary_writer.path) as reader:
+    ...     text = reader.read()
+    >>> with open(plain.summary_writer.path, encoding='utf-8') as f:
+    ...     text == f.read()
+    True
+    >>> with SummaryReader(game.summary_writer.path) as reader:
+    ...     [line for line in reader if line.startswith('ROUND')][2]
+    'ROUND 3:\\n'
+
+    # Only the last segment may end early
+    >>> with open(segments[0], 'r+b') as f:
+    ...     f.truncate(60)
+    60
+    >>> with SummaryReader(game.summary_writer.path) as reader:
+    ...     reader.read()
+    Traceback (most recent call last):
+    ...
+    EOFError: Compressed file ended before the end-of-stream marker was reached
+
+    # With no sync interval, summaries can be read after play_round,
+    # before the game is closed
+    >>> open_game = Blackjack(100, summary_dir=directory, rng=4, \\
+    ...     summary_options={'compression': 'gzip', 'flush_interval': 0})
+    >>> open_game.play_round(5, 17)
+    >>> with SummaryReader(open_game.summary_writer.path) as reader:
+    ...     reader.read() == text
+    True
+    >>> open_game.close()
+    >>> rmtree(directory)
+    """
+
+    def __init__(self, path):
+        self.paths = summary_segments(path)
+        self.file = None
+
+    def open_segment(self, path):
+        compression = None
+        for name, suffix in SummaryWriter.suffixes.items():
+            if suffix and path.endswith(suffix):
+                compression = name
+
+        return SummaryWriter.open_path(path, 'rt', compression)
+
+    def __iter__(self):
+        """
+        Yields the lines of every segment in turn. The last segment may
+        still be open for writing, so it may end at its writer's last
+        `sync` without an end-of-stream marker; any other truncated
+        segment raises EOFError.
+        """
+        for path in self.paths:
+            self.file = self.open_segment(path)
+            try:
+                yield from self.file
+            except EOFError:
+                if path != self.paths[-1]:
+                    raise
+            finally:
+                self.file.close()
+                self.file = None
+
+    def read(self):
+        """
+        Returns the whole summary text.
+        """
+        return ''.join(self)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,153 @@
+from struct import Struct
+
+from mapped import MappedFile
+
+# Round number, byte offset of the round in the summary file, and result
+index_record = Struct('<IQb')
+
+# Result of each winner named on a "Winner of ROUND" line
+winner_results = {b'Player': 1, b'Tied': 0, b'Dealer': -1}
+
+
+def index_path(summary_path):
+    """
+    Returns the path of the index kept next to a game summary file.
+    """
+    return summary_path + '.idx'
+
+
+def build_index(summary_path):
+    """
+    Rebuilds the index of an existing game summary file by scanning it
+    once, and returns the path of the index.
+    """
+    offset = 0
+    start = 0
+    round_number = 0
+    with open(summary_path, 'rb') as summary, \
+        open(index_path(summary_path), 'wb') as index:
+        for line in summary:
+            if line.startswith(b'ROUND '):
+                round_number = int(line.rstrip()[6:-1])
+                start = offset
+            elif line.startswith(b'Winner of ROUND '):
+                winner = line.rstrip().rsplit(b': ', 1)[1]
+                index.write(index_record.pack(round_number, start, \
+                    winner_results[winner]))
+            offset += len(line)
+
+    return index_path(summary_path)
+
+
+class SummaryIndex(MappedFile):
+    """
+    Reads the index of a game summary file, written by a SummaryWriter
+    created with `index=True` or rebuilt by `build_index`. Rounds can be
+    found and their winners counted without reading any card art.
+
+    >>> from shutil import rmtree
+    >>> from tempfile import mkdtemp
+    >>> from blackjack import Blackjack
+    >>> from deck import Shoe
+    >>> directory = mkdtemp()
+    >>> with Blackjack(10 ** 6, deck=Shoe(2), summary_dir=directory, \\
+    ...     summary_options={'index': True}, rng=2) as game:
+    ...     game.play_round(50, 17)
+    >>> path = game.summary_writer.path
+    >>> with SummaryIndex(path) as index:
+    ...     len(index)
+    ...     index.lookup(1)
+    ...     index.count_results() == game.get_results()
+    ...     index.read_round(37).splitlines()[0]
+    ...     index.read_round(37).count('Winner of')
+    50
+    (0, -1)
+    True
+    'ROUND 37:'
+    1
+
+    >>> with open(index_path(path), 'rb') as f:
+    ...     written = f.read()
+    >>> with open(build_index(path), 'rb') as f:
+    ...     f.read() == written
+    True
+    >>> rmtree(directory)
+    """
+
+    def __init__(self, summary_path):
+        super().__init__(index_path(summary_path))
+        self.summary_path = summary_path
+
+    def __len__(self):
+        return len(self.data) // index_record.size
+
+    def get_entry(self, index):
+        """
+        Returns (round number, offset, result) of the `index`th round in
+        the index.
+        """
+        return index_record.unpack_from(self.data, index * index_record.size)
+
+    def find(self, round_number):
+        """
+        Returns the position in the index of round `round_number`. A game
+        writes its rounds in increasing order, so the round is looked for
+        at its own position first and then by binary search.
+        """
+        low = 0
+        high = len(self)
+        guess = round_number - 1
+        if 0 <= guess < high and self.get_entry(guess)[0] == round_number:
+            return guess
+
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_entry(middle)[0] < round_number:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self) and self.get_entry(low)[0] == round_number:
+            return low
+
+        raise KeyError('Round {} is not in the index.'.format(round_number))
+
+    def lookup(self, round_number):
+        """
+        Returns (offset, result) of round `round_number`.
+        """
+        return self.get_entry(self.find(round_number))[1:]
+
+    def read_round(self, round_number):
+        """
+        Returns the summary text of round `round_number`, read directly
+        from its offset in the summary file.
+        """
+        position = self.find(round_number)
+        start = self.get_entry(position)[1]
+        with open(self.summary_path, 'rb') as summary:
+            summary.seek(start)
+            if position + 1 < len(self):
+                data = summary.read(self.get_entry(position + 1)[1] - start)
+            else:
+                data = summary.read()
+
+        return data.decode('utf-8')
+
+    def results(self):
+        """
+        Yields (round number, result) for every round in the index.
+        """
+        for round_number, offset, result in index_record.iter_unpack( \
+            self.data):
+            yield round_number, result
+
+    def count_results(self):
+        """
+        Returns the number of rounds won (1), tied (0) and lost (-1) by the
+        player, like `Blackjack.get_results`.
+        """
+        counts = {1: 0, 0: 0, -1: 0}
+        for round_number, result in self.results():
+            counts[result] += 1
+
+        return counts
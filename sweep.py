@@ -0,0 +1,135 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import product
+from os import cpu_count
+
+from numpy.random import SeedSequence
+
+from blackjack import Blackjack
+
+
+def play_games(stand_threshold, wallet, num_rounds, num_games, seed_seq, \
+    summaries=False):
+    """
+    Plays `num_games` games of `num_rounds` rounds and returns their
+    combined statistics. Each game draws from its own stream spawned
+    from `seed_seq`, and writes a game summary file if `summaries` is
+    True.
+    """
+    stats = {'games': 0, 'rounds': 0, 'wins': 0, 'ties': 0, 'losses': 0, \
+        'wallet': 0}
+    for game_seq in seed_seq.spawn(num_games):
+        with Blackjack(wallet, summaries=summaries, rng=game_seq) as game:
+            game.play_round(num_rounds, stand_threshold)
+        results = game.get_results()
+        stats['games'] += 1
+        stats['rounds'] += results[1] + results[0] + results[-1]
+        stats['wins'] += results[1]
+        stats['ties'] += results[0]
+        stats['losses'] += results[-1]
+        stats['wallet'] += game.wallet
+
+    return stats
+
+
+def merge_stats(total, stats):
+    """
+    Adds the counts in `stats` to `total`.
+    """
+    for key in stats:
+        total[key] = total.get(key, 0) + stats[key]
+
+    return total
+
+
+def run_sweep(stand_thresholds, wallets, num_rounds, num_games, \
+    entropy=None, processes=None, chunk_size=100):
+    """
+    Plays `num_games` games of `num_rounds` rounds for every pair of
+    stand threshold and starting wallet, spread over a pool of
+    `processes` worker processes (all cores by default).
+
+    Each cell of the grid is split into chunks of at most `chunk_size`
+    games. Every chunk gets its own SeedSequence spawned from `entropy`,
+    and every game its own stream spawned from that, so a sweep with the
+    same arguments and entropy returns the same statistics however many
+    processes run it. Without `entropy`, fresh entropy is drawn and
+    recorded in the statistics, so the sweep can still be repeated.
+
+    Returns:
+        A dictionary mapping (stand_threshold, wallet) to the number of
+        games, rounds played, rounds won, tied and lost by the player,
+        the sum of the final wallets, and the sweep's 'entropy'.
+
+    >>> stats = run_sweep([15, 17], [10], 3, 5, entropy=20, processes=2, \\
+    ...     chunk_size=2)
+    >>> sorted(stats)
+    [(15, 10), (17, 10)]
+    >>> stats[(15, 10)]['games']
+    5
+    >>> stats == run_sweep([15, 17], [10], 3, 5, entropy=20, processes=3, \\
+    ...     chunk_size=2)
+    True
+    >>> stats = run_sweep([16], [10], 3, 4, processes=2)
+    >>> stats == run_sweep([16], [10], 3, 4, stats[(16, 10)]['entropy'], \\
+    ...     processes=2)
+    True
+    """
+    if processes is None:
+        processes = cpu_count()
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return run_tasks(pool, stand_thresholds, wallets, num_rounds, \
+            num_games, entropy, chunk_size, False)
+
+
+def run_in_threads(stand_thresholds, wallets, num_rounds, num_games, \
+    entropy=None, threads=None, chunk_size=100, summaries=False):
+    """
+    Plays the same grid of games as `run_sweep` on a pool of `threads`
+    threads in this process, and returns the same statistics for the
+    same entropy. Threads only overlap while games wait on I/O, so this
+    suits games that write summaries (`summaries` True); every game gets
+    its own game number and summary file.
+
+    >>> stats = run_in_threads([15, 17], [10], 3, 5, entropy=20, \\
+    ...     threads=4, chunk_size=2)
+    >>> stats == run_sweep([15, 17], [10], 3, 5, entropy=20, processes=2, \\
+    ...     chunk_size=2)
+    True
+    >>> with ThreadPoolExecutor(max_workers=8) as pool:
+    ...     games = list(pool.map(lambda i: Blackjack(10, \\
+    ...         summaries=False), range(200)))
+    >>> len(set(game.game_number for game in games))
+    200
+    """
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return run_tasks(pool, stand_thresholds, wallets, num_rounds, \
+            num_games, entropy, chunk_size, summaries)
+
+
+def run_tasks(pool, stand_thresholds, wallets, num_rounds, num_games, \
+    entropy, chunk_size, summaries):
+    """
+    Splits the grid into chunks of at most `chunk_size` games, plays
+    them on the executor `pool` and merges their statistics.
+    """
+    tasks = []
+    for stand_threshold, wallet in product(stand_thresholds, wallets):
+        for start in range(0, num_games, chunk_size):
+            tasks.append((stand_threshold, wallet, num_rounds, \
+                min(chunk_size, num_games - start)))
+
+    root = SeedSequence(entropy)
+    seed_seqs = root.spawn(len(tasks))
+
+    stats = {}
+    futures = [pool.submit(play_games, *task, seed_seq, summaries) \
+        for task, seed_seq in zip(tasks, seed_seqs)]
+    for task, future in zip(tasks, futures):
+        key = (task[0], task[1])
+        merge_stats(stats.setdefault(key, {}), future.result())
+    # Recorded so that a sweep with drawn entropy can be repeated
+    for key in stats:
+        stats[key]['entropy'] = root.entropy
+
+    return stats